@@ -12,14 +12,18 @@ Author: Auto Intel Team
 Schedule: Every 6 hours
 """
 
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from airflow import DAG
+from airflow.decorators import task
 from airflow.operators.python_operator import PythonOperator
-from airflow.operators.bash_operator import BashOperator
 from airflow.operators.dummy_operator import DummyOperator
 from airflow.operators.email_operator import EmailOperator
 from airflow.providers.http.operators.http import SimpleHttpOperator
 from airflow.providers.postgres.operators.postgres import PostgresOperator
+from airflow.utils.task_group import TaskGroup
 import requests
 import json
 
@@ -33,7 +37,6 @@ default_args = {
     'retries': 2,
     'retry_delay': timedelta(minutes=5),
     'email': ['admin@auto-intel.com'],  # Update with your email
-    'catchup': False,
 }
 
 # Create the DAG
@@ -44,10 +47,79 @@ dag = DAG(
     schedule_interval=timedelta(hours=6),
     catchup=False,
     tags=['auto_intel', 'automotive', 'data_intelligence', 'nlp', 'sentiment_analysis'],
-    max_active_runs=1,
-    concurrency=3,
+    max_active_runs=1,  # Never overlap runs (6-hour schedule, clears, backfills)
+    max_active_tasks=3,  # The post-update group's three checks are the widest stage
 )
 
+SCRAPY_PROJECT_PATH = '/opt/airflow/projects/auto_intel_project'
+
+# Pools isolating the I/O-heavy crawls and CPU-heavy analysis from cheap checks.
+# Create them once with:
+#   airflow pools set scrapy_pool 2 "Scrapy crawls"
+#   airflow pools set analysis_pool 4 "NLP and correlation analysis"
+SCRAPY_POOL = 'scrapy_pool'
+ANALYSIS_POOL = 'analysis_pool'
+
+# =============================================================================
+# STAGE CALLABLES
+# =============================================================================
+
+@task
+def run_spider(spider_name: str):
+    """Run a Scrapy spider in the worker's interpreter instead of a fresh subprocess"""
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.utils.project import get_project_settings
+
+    os.chdir(SCRAPY_PROJECT_PATH)
+    if SCRAPY_PROJECT_PATH not in sys.path:
+        sys.path.insert(0, SCRAPY_PROJECT_PATH)
+
+    settings = get_project_settings()
+    settings.set('LOG_LEVEL', 'INFO')
+    process = CrawlerProcess(settings)
+    process.crawl(spider_name)
+    process.start()
+
+
+def validate_data():
+    print("Data validation completed successfully")
+
+
+def process_data():
+    print("Data processing and cleaning completed")
+
+
+def run_nlp_analysis():
+    print("NLP analysis completed successfully")
+
+
+def run_correlation_analysis():
+    print("Correlation analysis completed successfully")
+
+
+def monitor_performance():
+    print("Performance monitoring completed")
+
+
+def check_data_quality():
+    print("Data quality validation passed")
+
+
+def run_analysis_stage():
+    """Run the in-process stages sequentially and the two AI analyses concurrently"""
+    validate_data()
+    process_data()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(run_nlp_analysis), executor.submit(run_correlation_analysis)]
+        for future in futures:
+            future.result()
+
+
+def run_post_update_checks():
+    """Run the post-update monitoring and data quality checks"""
+    monitor_performance()
+    check_data_quality()
+
 # =============================================================================
 # TASK DEFINITIONS
 # =============================================================================
@@ -59,46 +131,29 @@ start = DummyOperator(
 )
 
 # Data collection tasks
-collect_news_data = BashOperator(
+collect_news_data = run_spider.override(
     task_id='collect_news_data',
-    bash_command='cd /opt/airflow/projects/auto_intel_project && python -m scrapy crawl auto_news -s LOG_LEVEL=INFO',
+    pool=SCRAPY_POOL,
+    max_active_tis_per_dag=1,
     dag=dag,
     retries=3,
     retry_delay=timedelta(minutes=2),
-)
+)('auto_news').operator
 
-collect_reviews_data = BashOperator(
+collect_reviews_data = run_spider.override(
     task_id='collect_reviews_data',
-    bash_command='cd /opt/airflow/projects/auto_intel_project && python -m scrapy crawl auto_reviews -s LOG_LEVEL=INFO',
+    pool=SCRAPY_POOL,
+    max_active_tis_per_dag=1,
     dag=dag,
     retries=3,
     retry_delay=timedelta(minutes=2),
-)
-
-# Data validation task
-validate_data = PythonOperator(
-    task_id='validate_data',
-    python_callable=lambda: print("Data validation completed successfully"),
-    dag=dag,
-)
-
-# Data processing task
-process_data = PythonOperator(
-    task_id='process_data',
-    python_callable=lambda: print("Data processing and cleaning completed"),
-    dag=dag,
-)
+)('auto_reviews').operator
 
-# AI analysis task
-run_nlp_analysis = PythonOperator(
-    task_id='run_nlp_analysis',
-    python_callable=lambda: print("NLP analysis completed successfully"),
-    dag=dag,
-)
-
-run_correlation_analysis = PythonOperator(
-    task_id='run_correlation_analysis',
-    python_callable=lambda: print("Correlation analysis completed successfully"),
+# Analysis stage: validation, processing and both AI analyses in one task instance
+analysis_stage = PythonOperator(
+    task_id='analysis_stage',
+    pool=ANALYSIS_POOL,
+    python_callable=run_analysis_stage,
     dag=dag,
 )
 
@@ -113,42 +168,37 @@ update_database = PostgresOperator(
     dag=dag,
 )
 
-# Health check tasks
-check_api_health = SimpleHttpOperator(
-    task_id='check_api_health',
-    http_conn_id='auto_intel_api',
-    endpoint='/health',
-    method='GET',
-    expected_response_codes=[200],
-    dag=dag,
-    retries=2,
-    retry_delay=timedelta(minutes=1),
-)
-
-check_dashboard_health = SimpleHttpOperator(
-    task_id='check_dashboard_health',
-    http_conn_id='auto_intel_dashboard',
-    endpoint='/_stcore/health',
-    method='GET',
-    expected_response_codes=[200],
-    dag=dag,
-    retries=2,
-    retry_delay=timedelta(minutes=1),
-)
-
-# Performance monitoring task
-monitor_performance = PythonOperator(
-    task_id='monitor_performance',
-    python_callable=lambda: print("Performance monitoring completed"),
-    dag=dag,
-)
-
-# Data quality check task
-check_data_quality = PythonOperator(
-    task_id='check_data_quality',
-    python_callable=lambda: print("Data quality validation passed"),
-    dag=dag,
-)
+# Post-update health checks and monitoring, grouped in the UI
+with TaskGroup('post_update', dag=dag) as post_update:
+    # Health check tasks
+    check_api_health = SimpleHttpOperator(
+        task_id='check_api_health',
+        http_conn_id='auto_intel_api',
+        endpoint='/health',
+        method='GET',
+        expected_response_codes=[200],
+        dag=dag,
+        retries=2,
+        retry_delay=timedelta(minutes=1),
+    )
+
+    check_dashboard_health = SimpleHttpOperator(
+        task_id='check_dashboard_health',
+        http_conn_id='auto_intel_dashboard',
+        endpoint='/_stcore/health',
+        method='GET',
+        expected_response_codes=[200],
+        dag=dag,
+        retries=2,
+        retry_delay=timedelta(minutes=1),
+    )
+
+    # Performance monitoring and data quality checks
+    monitor_pipeline = PythonOperator(
+        task_id='monitor_pipeline',
+        python_callable=run_post_update_checks,
+        dag=dag,
+    )
 
 # Notification task
 send_success_notification = EmailOperator(
@@ -185,23 +235,14 @@ end = DummyOperator(
 # Parallel data collection
 start >> [collect_news_data, collect_reviews_data]
 
-# Data collection must complete before validation
-[collect_news_data, collect_reviews_data] >> validate_data
-
-# Sequential data processing
-validate_data >> process_data
+# Data collection must complete before the analysis stage
+[collect_news_data, collect_reviews_data] >> analysis_stage
 
-# Parallel AI analysis
-process_data >> [run_nlp_analysis, run_correlation_analysis]
+# Analysis must complete before database update
+analysis_stage >> update_database
 
-# AI analysis must complete before database update
-[run_nlp_analysis, run_correlation_analysis] >> update_database
-
-# Parallel health checks and monitoring
-update_database >> [check_api_health, check_dashboard_health, monitor_performance, check_data_quality]
-
-# All tasks must complete before notification and end
-[check_api_health, check_dashboard_health, monitor_performance, check_data_quality] >> send_success_notification
+# Parallel health checks and monitoring; all must complete before notification
+update_database >> post_update >> send_success_notification
 
 # Final completion
 send_success_notification >> end
@@ -226,6 +267,11 @@ automating the collection, processing, analysis, and monitoring of automotive ma
 6. **Performance Monitoring**: Tracks pipeline performance metrics
 7. **Data Quality Validation**: Ensures analysis results meet quality standards
 
+### Pools
+- `scrapy_pool` (2 slots): Scrapy collection tasks
+- `analysis_pool` (4 slots): NLP and correlation analysis
+- Health checks and monitoring stay on `default_pool` so they are never starved
+
 ### Schedule
 - **Frequency**: Every 6 hours
 - **Start Time**: January 1, 2024
@@ -264,14 +310,10 @@ automating the collection, processing, analysis, and monitoring of automotive ma
 start.doc_md = "Pipeline start marker"
 collect_news_data.doc_md = "Collects automotive news articles using Scrapy spider"
 collect_reviews_data.doc_md = "Collects car reviews using Scrapy spider"
-validate_data.doc_md = "Validates collected data for quality and schema compliance"
-process_data.doc_md = "Processes and cleans data for analysis"
-run_nlp_analysis.doc_md = "Performs natural language processing analysis"
-run_correlation_analysis.doc_md = "Performs statistical correlation analysis"
+analysis_stage.doc_md = "Validates and processes data, then runs NLP and correlation analysis in parallel"
 update_database.doc_md = "Updates database with pipeline execution logs"
 check_api_health.doc_md = "Verifies API service health and availability"
 check_dashboard_health.doc_md = "Verifies dashboard service health and availability"
-monitor_performance.doc_md = "Monitors pipeline performance metrics"
-check_data_quality.doc_md = "Validates data quality and analysis results"
+monitor_pipeline.doc_md = "Monitors pipeline performance and validates data quality"
 send_success_notification.doc_md = "Sends success notification email"
 end.doc_md = "Pipeline completion marker"
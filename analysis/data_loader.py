@@ -1,140 +1,611 @@
 """
 Data loader module for Auto Intel Project
-Handles loading and preprocessing of scraped data from CSV files
+Handles loading and preprocessing of scraped data from CSV or Parquet files
 """
 
+import os
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import csv as pa_csv
 from datetime import datetime
-from typing import Tuple, Optional
+from functools import cached_property
+from typing import Iterator, Tuple, Optional
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Multi-threaded Arrow CSV parsing; scraped text may contain quoted newlines
+CSV_READ_OPTIONS = pa_csv.ReadOptions(block_size=64 << 20, use_threads=True)
+CSV_PARSE_OPTIONS = pa_csv.ParseOptions(newlines_in_values=True)
+
+# Dates are exported as ISO 8601, so they are parsed while the CSV is read
+DATE_COLUMN = 'publication_date'
+
+# Text columns are held as Arrow strings so .str methods run in C
+TEXT_DTYPE = 'string[pyarrow]'
+
+# Right-closed bins, as with pd.cut: code i covers (bins[i], bins[i + 1]]
+PRICE_BINS = np.array([0, 20000, 40000, 60000, 80000, np.inf])
+PRICE_LABELS = pd.Index(['Budget', 'Mid-range', 'Premium', 'Luxury', 'Ultra-luxury'])
+RATING_BINS = np.array([0, 2.5, 3.5, 4.5, 5.0])
+RATING_LABELS = pd.Index(['Poor', 'Average', 'Good', 'Excellent'])
+
+# Source breakdowns only report the busiest outlets
+SOURCE_TOP_K = 20
+
+# The separators str.split() recognises: ASCII bytes plus the multi-byte Unicode spaces
+ASCII_WHITESPACE = np.zeros(256, dtype=bool)
+ASCII_WHITESPACE[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+UNICODE_WHITESPACE = r'[\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}]'
+
+
+def _word_counts(strings: pa.Array) -> np.ndarray:
+    """
+    Count whitespace-separated words by scanning the UTF-8 buffer for word starts
+    
+    Args:
+        strings: Arrow string array
+        
+    Returns:
+        Word count per element, matching len(str.split()); null slots count as 0
+    """
+    strings = strings.cast(pa.large_string())
+    offsets = np.frombuffer(strings.buffers()[1], dtype=np.int64)[strings.offset:strings.offset + len(strings) + 1]
+    data_buffer = strings.buffers()[2]
+    data = np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None else np.zeros(0, dtype=np.uint8)
+    
+    # Fold the multi-byte separators into a plain space so a byte lookup suffices
+    if (data[offsets[0]:offsets[-1]] >= 0x80).any():
+        strings = pc.replace_substring_regex(strings, UNICODE_WHITESPACE, ' ')
+        offsets = np.frombuffer(strings.buffers()[1], dtype=np.int64)[strings.offset:strings.offset + len(strings) + 1]
+        data = np.frombuffer(strings.buffers()[2], dtype=np.uint8)
+    
+    # A word starts at a non-space byte that follows a space or opens its string
+    space = ASCII_WHITESPACE[data]
+    starts = ~space
+    starts[1:] &= space[:-1]
+    first = offsets[:-1][offsets[:-1] < offsets[1:]]
+    starts[first] = ~space[first]
+    
+    cumulative = np.concatenate(([0], np.cumsum(starts, dtype=np.int64)))
+    return cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+
+
+def _text_features(values: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """
+    Clean a text column and derive its length features with Arrow compute kernels
+    
+    Args:
+        values: Raw text column
+        
+    Returns:
+        Tuple of (stripped text, character length, word count)
+    """
+    strings = pa.array(values.astype(TEXT_DTYPE))
+    # Arrow-backed columns read in several blocks or row groups arrive chunked
+    if isinstance(strings, pa.ChunkedArray):
+        strings = strings.combine_chunks()
+    stripped = pc.utf8_trim_whitespace(strings)
+    lengths = pc.utf8_length(stripped)
+    
+    word_counts = pa.array(_word_counts(stripped), mask=pc.is_null(stripped).to_numpy(zero_copy_only=False))
+    
+    return (
+        pd.Series(pd.array(stripped, dtype=TEXT_DTYPE), index=values.index),
+        pd.Series(pd.array(lengths, dtype='Int64'), index=values.index),
+        pd.Series(pd.array(word_counts, dtype='Int64'), index=values.index)
+    )
+
+
+def _categorical_text(values: pd.Series) -> pd.Categorical:
+    """
+    Strip and dictionary-encode a low-cardinality text column, stripping only its distinct values
+    
+    Args:
+        values: Raw text column
+        
+    Returns:
+        Categorical of the stripped text with sorted categories, as astype('category') gives
+    """
+    codes, uniques = pd.factorize(values)
+    stripped = pd.Categorical(uniques.astype(TEXT_DTYPE).str.strip())
+    # Missing values are coded -1, which picks the trailing -1 of the lookup
+    lookup = np.append(stripped.codes, -1)
+    return pd.Categorical.from_codes(lookup[codes], categories=stripped.categories)
+
+
+def _as_datetime(values: pd.Series) -> pd.Series:
+    """
+    Coerce a date column to datetime64 unless it was already parsed at read time
+    
+    Args:
+        values: Parsed or raw date column
+        
+    Returns:
+        Datetime column with unparseable values as NaT
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, errors='coerce')
+
+
+def _as_float32(values: pd.Series) -> pd.Series:
+    """
+    Coerce a numeric column to float32 unless the schema already typed it at read time
+    
+    Args:
+        values: Typed or raw numeric column
+        
+    Returns:
+        float32 column with unparseable values as NaN
+    """
+    if values.dtype == np.float32:
+        return values
+    return pd.to_numeric(values, errors='coerce').astype(np.float32)
+
+
+def _bucketize(values: pd.Series, bins: np.ndarray, labels: pd.Index) -> pd.Categorical:
+    """
+    Assign values to ordered, right-closed bins without going through pd.cut
+    
+    Args:
+        values: Numeric column
+        bins: Monotonic bin edges
+        labels: One label per bin
+        
+    Returns:
+        Ordered Categorical; values outside the bins or missing map to NaN
+    """
+    data = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    codes = np.searchsorted(bins, data, side='left') - 1
+    codes[np.isnan(data) | (codes >= len(labels))] = -1
+    return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+
+def top_counts(values: pd.Series, k: int = SOURCE_TOP_K) -> dict:
+    """
+    The k most frequent values, counted over category codes with a bincount
+    
+    Args:
+        values: Column to count, ideally categorical
+        k: Number of values to keep
+        
+    Returns:
+        Dictionary mapping value to count, most frequent first
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, categories = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, categories = pd.factorize(values)
+    counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+    top = np.argsort(-counts, kind='stable')[:k]
+    return {categories[i]: int(counts[i]) for i in top if counts[i]}
+
+
+def _null_counts(df: pd.DataFrame) -> dict:
+    """
+    Missing values per column without materialising a boolean frame
+    
+    Args:
+        df: Any DataFrame
+        
+    Returns:
+        Dictionary mapping column name to null count
+    """
+    counts = {}
+    for column, values in df.items():
+        dtype = values.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            missing = np.count_nonzero(values.cat.codes.to_numpy() == -1)
+        elif isinstance(dtype, (pd.StringDtype, pd.ArrowDtype)) and getattr(dtype, 'storage', 'pyarrow') == 'pyarrow':
+            # Arrow keeps the null count in the array metadata
+            missing = pa.array(values).null_count
+        elif dtype.kind == 'f':
+            missing = np.count_nonzero(np.isnan(values.to_numpy()))
+        else:
+            missing = values.isna().sum()
+        counts[column] = int(missing)
+    return counts
+
+
+def _clean_table(table: pa.Table, required: list) -> Tuple[pa.Table, dict]:
+    """
+    Apply the preprocessing that the summary depends on to a raw Arrow table
+    
+    Args:
+        table: Raw table as read from CSV or Parquet
+        required: Text columns whose missing rows are dropped
+        
+    Returns:
+        Tuple of (stripped, typed and filtered table, null counts with the
+        derived length and word count columns that preprocessing adds)
+    """
+    columns = {}
+    for name, values in zip(table.column_names, table.columns):
+        if name == DATE_COLUMN:
+            if pa.types.is_date(values.type):
+                values = pc.cast(values, pa.timestamp('us'))
+            elif not pa.types.is_timestamp(values.type):
+                values = pa.array(_as_datetime(values.to_pandas()))
+        elif name in ('rating', 'price'):
+            if values.type != pa.float32():
+                values = pa.array(_as_float32(values.to_pandas()), type=pa.float32())
+        elif pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+            values = pc.utf8_trim_whitespace(values)
+        columns[name] = values
+    
+    keep = pc.and_(*[pc.is_valid(columns[name]) for name in required])
+    table = pa.table(columns).filter(keep)
+    
+    missing = {name: table[name].null_count for name in table.column_names}
+    for feature in ('length', 'word_count'):
+        for name in required:
+            missing[f"{name}_{feature}"] = table[name].null_count
+    return table, missing
+
+
+def _arrow_top_counts(values: pa.ChunkedArray, k: int = SOURCE_TOP_K) -> dict:
+    """
+    The k most frequent values of an Arrow column, ordered as top_counts orders them
+    
+    Args:
+        values: Arrow text column
+        k: Number of values to keep
+        
+    Returns:
+        Dictionary mapping value to count, most frequent first
+    """
+    counts = pc.value_counts(values.drop_null())
+    counts = pa.table({'values': counts.field('values'), 'counts': counts.field('counts')})
+    order = pc.sort_indices(counts, sort_keys=[('counts', 'descending'), ('values', 'ascending')])
+    top = counts.take(order[:k])
+    return dict(zip(top['values'].to_pylist(), top['counts'].to_pylist()))
+
+
+def _arrow_mean(values) -> float:
+    """Mean of an Arrow column as a float, NaN when it has no values"""
+    return _as_float(pc.mean(values))
+
+
+def _as_float(scalar: pa.Scalar) -> float:
+    """Arrow scalar as a float, NaN when null"""
+    value = scalar.as_py()
+    return float('nan') if value is None else float(value)
+
+
+def _as_timestamp(scalar: pa.Scalar) -> pd.Timestamp:
+    """Arrow timestamp scalar as a pandas Timestamp, NaT when null"""
+    value = scalar.as_py()
+    return pd.NaT if value is None else pd.Timestamp(value)
+
+
+def _parquet_copy_path(path: str) -> str:
+    """Path of the Parquet copy materialized next to a CSV file"""
+    return os.path.splitext(path)[0] + '.parquet'
+
+
+def _prefer_parquet(path: str) -> str:
+    """
+    The Parquet copy of a CSV file when one exists and is at least as new as the CSV
+    
+    Args:
+        path: Configured CSV file, Parquet file or Parquet dataset directory
+        
+    Returns:
+        Path to read from
+    """
+    if not path.endswith('.csv'):
+        return path
+    parquet_path = _parquet_copy_path(path)
+    if not os.path.exists(parquet_path):
+        return path
+    if os.path.exists(path) and os.path.getmtime(parquet_path) < os.path.getmtime(path):
+        # The CSV was rewritten after the copy was made
+        return path
+    return parquet_path
+
 
 class DataLoader:
     """Loads and preprocesses scraped automotive data"""
     
-    def __init__(self, article_news_path: str, car_reviews_path: str):
+    # Raw columns used by preprocessing and their types; CSV reads skip type inference
+    # with these and Parquet reads project onto them
+    ARTICLE_SCHEMA = {
+        'title': pa.string(),
+        'link': pa.string(),
+        'author': pa.string(),
+        DATE_COLUMN: pa.timestamp('us'),
+        'source': pa.string(),
+        'content': pa.string()
+    }
+    REVIEW_SCHEMA = {
+        'title': pa.string(),
+        'link': pa.string(),
+        'author': pa.string(),
+        DATE_COLUMN: pa.timestamp('us'),
+        'source': pa.string(),
+        'verdict': pa.string(),
+        'rating': pa.float32(),
+        'price': pa.float32()
+    }
+    
+    def __init__(self, article_news_path: str, car_reviews_path: str, since: Optional[str] = None):
         """
-        Initialize DataLoader with paths to CSV files
+        Initialize DataLoader with paths to CSV files or Parquet datasets
+        
+        A CSV file is read from its Parquet copy instead when that copy is up to date.
         
         Args:
-            article_news_path: Path to article_news CSV file
-            car_reviews_path: Path to car_reviews CSV file
+            article_news_path: Path to article_news CSV file or Parquet dataset
+            car_reviews_path: Path to car_reviews CSV file or Parquet dataset
+            since: Optional YYYY-MM-DD cutoff on the Parquet date partitions
+        """
+        # Typed Parquet copies written by materialize_parquet skip CSV parsing
+        self.article_news_path = _prefer_parquet(article_news_path)
+        self.car_reviews_path = _prefer_parquet(car_reviews_path)
+        self.since = since
+        
+    def _read_arrow_table(self, path: str, schema: dict) -> pa.Table:
+        """
+        Read a CSV file with PyArrow, or a date-partitioned Parquet dataset with column projection
+        
+        Args:
+            path: CSV file, Parquet file or Parquet dataset directory
+            schema: Column types for the CSV; its columns are read from Parquet
+            
+        Returns:
+            Loaded Arrow table
+        """
+        if not (path.endswith('.parquet') or os.path.isdir(path)):
+            # Empty strings become nulls as with pd.read_csv
+            def read_csv(column_types: dict) -> pa.Table:
+                convert_options = pa_csv.ConvertOptions(
+                    column_types=column_types,
+                    timestamp_parsers=[pa_csv.ISO8601],
+                    strings_can_be_null=True
+                )
+                table = pa_csv.read_csv(
+                    path,
+                    read_options=CSV_READ_OPTIONS,
+                    parse_options=CSV_PARSE_OPTIONS,
+                    convert_options=convert_options
+                )
+                return table
+            
+            try:
+                return read_csv(schema)
+            except pa.ArrowInvalid:
+                # Non-ISO dates or non-numeric cells: read as strings so preprocessing coerces them
+                logger.warning(f"Values not matching the schema in {path}, falling back to strings")
+                return read_csv(dict.fromkeys(schema, pa.string()))
+        
+        columns = list(schema)
+        if os.path.isfile(path):
+            # Keep a single file's column order, as for a CSV
+            file_order = {name: i for i, name in enumerate(pq.read_schema(path).names)}
+            columns.sort(key=lambda column: file_order.get(column, len(file_order)))
+        
+        filters = [('date', '>=', self.since)] if self.since else None
+        return pq.read_table(path, columns=columns, filters=filters)
+    
+    def _read_table(self, path: str, schema: dict) -> pd.DataFrame:
         """
-        self.article_news_path = article_news_path
-        self.car_reviews_path = car_reviews_path
-        self.article_news_df = None
-        self.car_reviews_df = None
+        Read a CSV file or Parquet dataset into a DataFrame
+        
+        Args:
+            path: CSV file, Parquet file or Parquet dataset directory
+            schema: Column types for the CSV; its columns are read from Parquet
+            
+        Returns:
+            Loaded DataFrame
+        """
+        return self._read_arrow_table(path, schema).to_pandas()
+        
+    @cached_property
+    def article_news_df(self) -> pd.DataFrame:
+        """Raw article news data, read on first access"""
+        logger.info("Loading article news data...")
+        df = self._read_table(self.article_news_path, self.ARTICLE_SCHEMA)
+        logger.info(f"Loaded {len(df)} article news records")
+        return df
+    
+    @cached_property
+    def car_reviews_df(self) -> pd.DataFrame:
+        """Raw car reviews data, read on first access"""
+        logger.info("Loading car reviews data...")
+        df = self._read_table(self.car_reviews_path, self.REVIEW_SCHEMA)
+        logger.info(f"Loaded {len(df)} car review records")
+        return df
+    
+    @cached_property
+    def processed_article_df(self) -> pd.DataFrame:
+        """Preprocessed article news data, computed once from the loaded dataset"""
+        return self.preprocess_article_news(self.article_news_df)
+    
+    @cached_property
+    def processed_reviews_df(self) -> pd.DataFrame:
+        """Preprocessed car reviews data, computed once from the loaded dataset"""
+        return self.preprocess_car_reviews(self.car_reviews_df)
         
     def load_data(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
-        Load both datasets from CSV files
+        (Re)load both datasets from CSV files or Parquet datasets
         
         Returns:
             Tuple of (article_news_df, car_reviews_df)
         """
+        # Fresh raw data invalidates every cached frame
+        for name in ('article_news_df', 'car_reviews_df', 'processed_article_df', 'processed_reviews_df'):
+            self.__dict__.pop(name, None)
+        
         try:
-            logger.info("Loading article news data...")
-            self.article_news_df = pd.read_csv(self.article_news_path)
-            logger.info(f"Loaded {len(self.article_news_df)} article news records")
-            
-            logger.info("Loading car reviews data...")
-            self.car_reviews_df = pd.read_csv(self.car_reviews_path)
-            logger.info(f"Loaded {len(self.car_reviews_df)} car review records")
-            
             return self.article_news_df, self.car_reviews_df
-            
         except Exception as e:
             logger.error(f"Error loading data: {e}")
             raise
     
-    def preprocess_article_news(self) -> pd.DataFrame:
+    def materialize_parquet(self) -> Tuple[str, str]:
         """
-        Preprocess article news data
+        Write typed Parquet copies of the CSV sources next to them, for later loaders to prefer
         
         Returns:
-            Preprocessed article news DataFrame
+            Tuple of (article_news, car_reviews) paths now holding Parquet data
+        """
+        paths = []
+        for path, schema in ((self.article_news_path, self.ARTICLE_SCHEMA), (self.car_reviews_path, self.REVIEW_SCHEMA)):
+            if path.endswith('.csv'):
+                parquet_path = _parquet_copy_path(path)
+                table = self._read_arrow_table(path, schema)
+                pq.write_table(table.select([name for name in table.column_names if name in schema]), parquet_path)
+                logger.info(f"Wrote Parquet copy of {path} to {parquet_path}")
+                path = parquet_path
+            paths.append(path)
+        return tuple(paths)
+    
+    def _read_chunks(self, path: str, schema: dict, chunk_rows: int) -> Iterator[pd.DataFrame]:
         """
-        if self.article_news_df is None:
-            self.load_data()
+        Stream a CSV file or Parquet dataset as DataFrames of at most chunk_rows rows
+        
+        Args:
+            path: CSV file, Parquet file or Parquet dataset directory
+            schema: Column types; text columns are typed at read, its columns are read from Parquet
+            chunk_rows: Maximum rows per chunk
             
-        df = self.article_news_df.copy()
+        Yields:
+            Raw DataFrame chunks with a running index across chunks
+        """
+        if not (path.endswith('.parquet') or os.path.isdir(path)):
+            # Numeric columns are left to inference so bad cells are coerced in preprocessing
+            text_dtypes = {column: str for column, arrow_type in schema.items() if arrow_type == pa.string()}
+            yield from pd.read_csv(
+                path,
+                chunksize=chunk_rows,
+                dtype=text_dtypes,
+                parse_dates=[DATE_COLUMN],
+                date_format='ISO8601'
+            )
+            return
         
-        # Convert publication_date to datetime
-        df['publication_date'] = pd.to_datetime(df['publication_date'], errors='coerce')
+        dataset = ds.dataset(path, format='parquet', partitioning='hive')
+        row_filter = ds.field('date') >= self.since if self.since else None
+        offset = 0
+        for batch in dataset.to_batches(columns=list(schema), filter=row_filter, batch_size=chunk_rows):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+    
+    def load_data_chunked(self, chunk_rows: int = 200_000) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Load and preprocess both datasets chunk by chunk, keeping only one raw chunk in memory
         
-        # Clean text fields
-        df['title'] = df['title'].astype(str).str.strip()
-        df['content'] = df['content'].astype(str).str.strip()
-        df['author'] = df['author'].astype(str).str.strip()
-        df['source'] = df['source'].astype(str).str.strip()
+        Args:
+            chunk_rows: Maximum rows parsed and preprocessed at a time
+            
+        Returns:
+            Tuple of preprocessed (article_news_df, car_reviews_df)
+        """
+        logger.info(f"Loading data in chunks of {chunk_rows} rows...")
+        article_df = pd.concat(
+            [self.preprocess_article_news(chunk)
+             for chunk in self._read_chunks(self.article_news_path, self.ARTICLE_SCHEMA, chunk_rows)]
+        )
+        reviews_df = pd.concat(
+            [self.preprocess_car_reviews(chunk)
+             for chunk in self._read_chunks(self.car_reviews_path, self.REVIEW_SCHEMA, chunk_rows)]
+        )
+        # Chunks with different category sets concatenate to plain strings; re-encode once
+        article_df, reviews_df = (
+            df.assign(**{col: df[col].astype('category') for col in ('author', 'source')})
+            for df in (article_df, reviews_df)
+        )
+        logger.info(f"Loaded {len(article_df)} article news and {len(reviews_df)} car review records")
+        
+        return article_df, reviews_df
+    
+    def preprocess_article_news(self, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Preprocess article news data
+        
+        Args:
+            df: Raw article news frame or chunk; defaults to the loaded dataset,
+                which is left unmodified and whose result is cached
+        
+        Returns:
+            Preprocessed article news DataFrame
+        """
+        if df is None:
+            return self.processed_article_df
+        
+        # Clean text fields and derive their length and word count features together
+        title, title_length, title_word_count = _text_features(df['title'])
+        content, content_length, content_word_count = _text_features(df['content'])
+        df = df.assign(
+            publication_date=_as_datetime(df[DATE_COLUMN]),
+            title=title,
+            content=content,
+            title_length=title_length,
+            content_length=content_length,
+            title_word_count=title_word_count,
+            content_word_count=content_word_count
+        )
         
         # Remove rows with missing essential data
         df = df.dropna(subset=['title', 'content'])
         
-        # Add text length features
-        df['title_length'] = df['title'].str.len()
-        df['content_length'] = df['content'].str.len()
-        
-        # Add word count features
-        df['title_word_count'] = df['title'].str.split().str.len()
-        df['content_word_count'] = df['content'].str.split().str.len()
+        # Dictionary-encode the low-cardinality text columns
+        df = df.assign(
+            author=_categorical_text(df['author']),
+            source=_categorical_text(df['source'])
+        )
         
         logger.info(f"Preprocessed {len(df)} article news records")
         return df
     
-    def preprocess_car_reviews(self) -> pd.DataFrame:
+    def preprocess_car_reviews(self, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Preprocess car reviews data
         
+        Args:
+            df: Raw car reviews frame or chunk; defaults to the loaded dataset,
+                which is left unmodified and whose result is cached
+        
         Returns:
             Preprocessed car reviews DataFrame
         """
-        if self.car_reviews_df is None:
-            self.load_data()
-            
-        df = self.car_reviews_df.copy()
-        
-        # Convert publication_date to datetime
-        df['publication_date'] = pd.to_datetime(df['publication_date'], errors='coerce')
-        
-        # Clean text fields
-        df['title'] = df['title'].astype(str).str.strip()
-        df['verdict'] = df['verdict'].astype(str).str.strip()
-        df['author'] = df['author'].astype(str).str.strip()
-        df['source'] = df['source'].astype(str).str.strip()
+        if df is None:
+            return self.processed_reviews_df
         
-        # Clean numeric fields
-        df['rating'] = pd.to_numeric(df['rating'], errors='coerce')
-        df['price'] = pd.to_numeric(df['price'], errors='coerce')
+        # Clean text fields and derive their length and word count features together
+        title, title_length, title_word_count = _text_features(df['title'])
+        verdict, verdict_length, verdict_word_count = _text_features(df['verdict'])
+        df = df.assign(
+            publication_date=_as_datetime(df[DATE_COLUMN]),
+            title=title,
+            verdict=verdict,
+            rating=_as_float32(df['rating']),
+            price=_as_float32(df['price']),
+            title_length=title_length,
+            verdict_length=verdict_length,
+            title_word_count=title_word_count,
+            verdict_word_count=verdict_word_count
+        )
         
         # Remove rows with missing essential data
         df = df.dropna(subset=['title', 'verdict'])
         
-        # Add text length features
-        df['title_length'] = df['title'].str.len()
-        df['verdict_length'] = df['verdict'].str.len()
-        
-        # Add word count features
-        df['title_word_count'] = df['title'].str.split().str.len()
-        df['verdict_word_count'] = df['verdict'].str.split().str.len()
-        
-        # Create price categories
-        df['price_category'] = pd.cut(
-            df['price'], 
-            bins=[0, 20000, 40000, 60000, 80000, float('inf')],
-            labels=['Budget', 'Mid-range', 'Premium', 'Luxury', 'Ultra-luxury']
-        )
-        
-        # Create rating categories
-        df['rating_category'] = pd.cut(
-            df['rating'],
-            bins=[0, 2.5, 3.5, 4.5, 5.0],
-            labels=['Poor', 'Average', 'Good', 'Excellent']
+        # Dictionary-encode the low-cardinality text columns and add category features
+        df = df.assign(
+            author=_categorical_text(df['author']),
+            source=_categorical_text(df['source']),
+            price_category=_bucketize(df['price'], PRICE_BINS, PRICE_LABELS),
+            rating_category=_bucketize(df['rating'], RATING_BINS, RATING_LABELS)
         )
         
         logger.info(f"Preprocessed {len(df)} car review records")
@@ -147,40 +618,106 @@ class DataLoader:
         Returns:
             Dictionary with summary statistics
         """
-        if self.article_news_df is None or self.car_reviews_df is None:
-            self.load_data()
-            
-        article_df = self.preprocess_article_news()
-        reviews_df = self.preprocess_car_reviews()
+        article_df = self.processed_article_df
+        reviews_df = self.processed_reviews_df
         
+        # One fused reduction per frame instead of a scan per statistic
+        article_dates = article_df['publication_date'].agg(['min', 'max'])
+        article_stats = article_df[['title_length', 'content_length']].mean()
+        review_dates = reviews_df['publication_date'].agg(['min', 'max'])
+        review_stats = reviews_df.agg({'rating': ['mean'], 'price': ['mean', 'min', 'max']})
+        
+        # source and the category columns are categorical, so the counts run over codes
         summary = {
             'article_news': {
                 'total_records': len(article_df),
                 'date_range': {
-                    'start': article_df['publication_date'].min(),
-                    'end': article_df['publication_date'].max()
+                    'start': article_dates['min'],
+                    'end': article_dates['max']
                 },
-                'sources': article_df['source'].value_counts().to_dict(),
-                'avg_title_length': article_df['title_length'].mean(),
-                'avg_content_length': article_df['content_length'].mean(),
-                'missing_data': article_df.isnull().sum().to_dict()
+                'sources': top_counts(article_df['source']),
+                'avg_title_length': article_stats['title_length'],
+                'avg_content_length': article_stats['content_length'],
+                'missing_data': _null_counts(article_df)
             },
             'car_reviews': {
                 'total_records': len(reviews_df),
                 'date_range': {
-                    'start': reviews_df['publication_date'].min(),
-                    'end': reviews_df['publication_date'].max()
+                    'start': review_dates['min'],
+                    'end': review_dates['max']
                 },
-                'sources': reviews_df['source'].value_counts().to_dict(),
-                'avg_rating': reviews_df['rating'].mean(),
-                'avg_price': reviews_df['price'].mean(),
+                'sources': top_counts(reviews_df['source']),
+                'avg_rating': float(review_stats.at['mean', 'rating']),
+                'avg_price': float(review_stats.at['mean', 'price']),
                 'price_range': {
-                    'min': reviews_df['price'].min(),
-                    'max': reviews_df['price'].max()
+                    'min': float(review_stats.at['min', 'price']),
+                    'max': float(review_stats.at['max', 'price'])
                 },
                 'rating_distribution': reviews_df['rating_category'].value_counts().to_dict(),
                 'price_distribution': reviews_df['price_category'].value_counts().to_dict(),
-                'missing_data': reviews_df.isnull().sum().to_dict()
+                'missing_data': _null_counts(reviews_df)
+            }
+        }
+        
+        return summary
+    
+    def get_raw_data_summary(self) -> dict:
+        """
+        Get the same summary as get_data_summary straight from the raw Arrow tables,
+        without building or caching the preprocessed DataFrames
+        
+        Returns:
+            Dictionary with summary statistics
+        """
+        article_table, article_missing = _clean_table(
+            self._read_arrow_table(self.article_news_path, self.ARTICLE_SCHEMA), ['title', 'content']
+        )
+        reviews_table, review_missing = _clean_table(
+            self._read_arrow_table(self.car_reviews_path, self.REVIEW_SCHEMA), ['title', 'verdict']
+        )
+        
+        article_dates = pc.min_max(article_table[DATE_COLUMN])
+        review_dates = pc.min_max(reviews_table[DATE_COLUMN])
+        price_range = pc.min_max(reviews_table['price'])
+        
+        # Only the category codes are materialised, to count and to find the misses
+        prices = reviews_table['price'].to_numpy()
+        ratings = reviews_table['rating'].to_numpy()
+        price_categories = pd.Series(_bucketize(pd.Series(prices), PRICE_BINS, PRICE_LABELS))
+        rating_categories = pd.Series(_bucketize(pd.Series(ratings), RATING_BINS, RATING_LABELS))
+        review_missing.update(
+            price_category=int(np.count_nonzero(price_categories.cat.codes.to_numpy() == -1)),
+            rating_category=int(np.count_nonzero(rating_categories.cat.codes.to_numpy() == -1))
+        )
+        
+        summary = {
+            'article_news': {
+                'total_records': article_table.num_rows,
+                'date_range': {
+                    'start': _as_timestamp(article_dates['min']),
+                    'end': _as_timestamp(article_dates['max'])
+                },
+                'sources': _arrow_top_counts(article_table['source']),
+                'avg_title_length': _arrow_mean(pc.utf8_length(article_table['title'])),
+                'avg_content_length': _arrow_mean(pc.utf8_length(article_table['content'])),
+                'missing_data': article_missing
+            },
+            'car_reviews': {
+                'total_records': reviews_table.num_rows,
+                'date_range': {
+                    'start': _as_timestamp(review_dates['min']),
+                    'end': _as_timestamp(review_dates['max'])
+                },
+                'sources': _arrow_top_counts(reviews_table['source']),
+                'avg_rating': _arrow_mean(reviews_table['rating']),
+                'avg_price': _arrow_mean(reviews_table['price']),
+                'price_range': {
+                    'min': _as_float(price_range['min']),
+                    'max': _as_float(price_range['max'])
+                },
+                'rating_distribution': rating_categories.value_counts().to_dict(),
+                'price_distribution': price_categories.value_counts().to_dict(),
+                'missing_data': review_missing
             }
         }
         
@@ -203,12 +740,21 @@ def load_sample_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Load and summarise the Auto Intel data")
+    parser.add_argument('--to-parquet', action='store_true', help="write typed Parquet copies of the CSV files first")
+    args = parser.parse_args()
+    
     # Test the data loader
     loader = DataLoader(
         article_news_path='project_data/article_news_202507212152.csv',
         car_reviews_path='project_data/car_reviews_202507231630.csv'
     )
     
+    if args.to_parquet:
+        loader.article_news_path, loader.car_reviews_path = loader.materialize_parquet()
+    
     # Load and preprocess data
     article_df, reviews_df = loader.load_data()
     processed_article_df = loader.preprocess_article_news()
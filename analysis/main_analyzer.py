@@ -5,9 +5,10 @@ Combines all analysis modules and provides a unified interface
 
 import pandas as pd
 import numpy as np
-import json
+import orjson
 import logging
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, List, Optional
 import os
 
@@ -20,6 +21,26 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# NumPy arrays and scalars serialise natively; float keys (rating distributions) are allowed
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(obj):
+    """Fallback for types orjson does not know, such as pandas Timestamps and Periods"""
+    return str(obj)
+
+
+def _dump_json(data) -> bytes:
+    """Serialise data with orjson"""
+    return orjson.dumps(data, default=_json_default, option=JSON_OPTIONS)
+
+
+def _write_bytes(path: str, payload: bytes) -> None:
+    """Write an already serialised payload in one call"""
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+
 class AutoIntelAnalyzer:
     """Main analyzer that orchestrates all analysis components"""
     
@@ -39,35 +60,39 @@ class AutoIntelAnalyzer:
         self.nlp_analyzer = NLPAnalyzer()
         self.correlation_analyzer = CorrelationAnalyzer()
         
-        # Data storage
-        self.article_df = None
-        self.reviews_df = None
-        self.processed_article_df = None
-        self.processed_reviews_df = None
-        
         # Analysis results
         self.analysis_results = {}
+    
+    # Data storage lives on the DataLoader, which loads and preprocesses once on first access
+    @property
+    def article_df(self) -> pd.DataFrame:
+        return self.data_loader.article_news_df
+    
+    @property
+    def reviews_df(self) -> pd.DataFrame:
+        return self.data_loader.car_reviews_df
+    
+    @property
+    def processed_article_df(self) -> pd.DataFrame:
+        return self.data_loader.processed_article_df
+    
+    @property
+    def processed_reviews_df(self) -> pd.DataFrame:
+        return self.data_loader.processed_reviews_df
         
     def load_and_preprocess_data(self) -> None:
         """Load and preprocess all data"""
         logger.info("Loading and preprocessing data...")
         
-        # Load raw data
-        self.article_df, self.reviews_df = self.data_loader.load_data()
-        
-        # Preprocess data
-        self.processed_article_df = self.data_loader.preprocess_article_news()
-        self.processed_reviews_df = self.data_loader.preprocess_car_reviews()
-        
-        logger.info("Data loading and preprocessing completed")
+        logger.info(
+            f"Data loading and preprocessing completed: {len(self.processed_article_df)} articles, "
+            f"{len(self.processed_reviews_df)} reviews"
+        )
     
     def run_nlp_analysis(self) -> Dict:
         """Run NLP analysis on both datasets"""
         logger.info("Running NLP analysis...")
         
-        if self.processed_article_df is None or self.processed_reviews_df is None:
-            self.load_and_preprocess_data()
-        
         # Run NLP analysis
         nlp_results = run_nlp_analysis(self.processed_article_df, self.processed_reviews_df)
         
@@ -80,14 +105,8 @@ class AutoIntelAnalyzer:
         """Run correlation analysis"""
         logger.info("Running correlation analysis...")
         
-        if self.processed_article_df is None or self.processed_reviews_df is None:
-            self.load_and_preprocess_data()
-        
-        # Get sentiment scores for correlation analysis
-        sentiment_scores = []
-        for verdict in self.processed_reviews_df['verdict'].dropna():
-            scores = self.nlp_analyzer.analyze_sentiment(verdict)
-            sentiment_scores.append(scores['compound'])
+        # Get sentiment scores for correlation analysis; cached for the frame by the NLP pass
+        sentiment_scores = self.nlp_analyzer.review_sentiment(self.processed_reviews_df).tolist()
         
         # Run correlation analysis
         correlation_results = self.correlation_analyzer.run_comprehensive_correlation_analysis(
@@ -101,6 +120,15 @@ class AutoIntelAnalyzer:
         
         return correlation_results
     
+    def run_data_summary(self) -> Dict:
+        """Summarise the datasets straight from the raw files, skipping preprocessing"""
+        logger.info("Summarising raw data...")
+        
+        data_summary = self.data_loader.get_raw_data_summary()
+        self.analysis_results['data_summary'] = data_summary
+        
+        return data_summary
+    
     def run_comprehensive_analysis(self) -> Dict:
         """Run all analysis components"""
         logger.info("Starting comprehensive analysis...")
@@ -108,7 +136,7 @@ class AutoIntelAnalyzer:
         # Load and preprocess data
         self.load_and_preprocess_data()
         
-        # Get data summary
+        # Get data summary; reuses the frames preprocessed above
         data_summary = self.data_loader.get_data_summary()
         self.analysis_results['data_summary'] = data_summary
         
@@ -137,83 +165,84 @@ class AutoIntelAnalyzer:
             logger.warning("No analysis results available. Run comprehensive analysis first.")
             return {}
         
+        key_findings = []
+        recommendations = []
+        trends = []
         insights = {
-            'key_findings': [],
-            'recommendations': [],
-            'trends': [],
+            'key_findings': key_findings,
+            'recommendations': recommendations,
+            'trends': trends,
             'anomalies': []
         }
         
         # Extract key findings from NLP analysis
-        if 'nlp_analysis' in self.analysis_results:
-            nlp_data = self.analysis_results['nlp_analysis']
+        nlp_data = self.analysis_results.get('nlp_analysis')
+        if nlp_data is not None:
+            article_data = nlp_data['article_news']
+            review_data = nlp_data['car_reviews']
             
             # Sentiment insights
-            article_sentiment = nlp_data['article_news']['sentiment']['contents']
-            review_sentiment = nlp_data['car_reviews']['sentiment']['verdicts']
+            article_compound = article_data['sentiment']['contents']['compound']
+            review_compound = review_data['sentiment']['verdicts']['compound']
             
-            if article_sentiment['compound'] > 0.1:
-                insights['key_findings'].append("Overall positive sentiment in automotive news articles")
-            elif article_sentiment['compound'] < -0.1:
-                insights['key_findings'].append("Overall negative sentiment in automotive news articles")
+            if article_compound > 0.1:
+                key_findings.append("Overall positive sentiment in automotive news articles")
+            elif article_compound < -0.1:
+                key_findings.append("Overall negative sentiment in automotive news articles")
             else:
-                insights['key_findings'].append("Neutral sentiment in automotive news articles")
+                key_findings.append("Neutral sentiment in automotive news articles")
             
-            if review_sentiment['compound'] > 0.1:
-                insights['key_findings'].append("Overall positive sentiment in car reviews")
-            elif review_sentiment['compound'] < -0.1:
-                insights['key_findings'].append("Overall negative sentiment in car reviews")
+            if review_compound > 0.1:
+                key_findings.append("Overall positive sentiment in car reviews")
+            elif review_compound < -0.1:
+                key_findings.append("Overall negative sentiment in car reviews")
             else:
-                insights['key_findings'].append("Neutral sentiment in car reviews")
+                key_findings.append("Neutral sentiment in car reviews")
             
             # Top entities
-            if 'entities' in nlp_data['car_reviews']:
-                car_entities = nlp_data['car_reviews']['entities'].get('CAR_BRAND', [])
+            entities = review_data.get('entities')
+            if entities is not None:
+                car_entities = entities.get('CAR_BRAND', [])
                 if car_entities:
-                    insights['key_findings'].append(f"Most mentioned car brands: {', '.join(car_entities[:5])}")
+                    key_findings.append(f"Most mentioned car brands: {', '.join(car_entities[:5])}")
         
-        # Extract insights from correlation analysis
-        if 'correlation_analysis' in self.analysis_results:
-            corr_data = self.analysis_results['correlation_analysis']
-            
+        # Extract findings, recommendations and trends from correlation analysis
+        corr_data = self.analysis_results.get('correlation_analysis')
+        if corr_data is not None:
             # Price-rating correlation
             price_rating_corr = corr_data['price_rating_correlation']['pearson_correlation']
             if abs(price_rating_corr) > 0.3:
                 if price_rating_corr > 0:
-                    insights['key_findings'].append("Strong positive correlation between price and rating")
+                    key_findings.append("Strong positive correlation between price and rating")
                 else:
-                    insights['key_findings'].append("Strong negative correlation between price and rating")
+                    key_findings.append("Strong negative correlation between price and rating")
             else:
-                insights['key_findings'].append("Weak correlation between price and rating")
+                key_findings.append("Weak correlation between price and rating")
             
-            # Source insights
-            if 'source_correlations' in corr_data:
-                sources = corr_data['source_correlations']
-                best_source = max(sources.items(), key=lambda x: x[1]['avg_rating'])
-                insights['key_findings'].append(f"Highest average rating from: {best_source[0]} ({best_source[1]['avg_rating']:.2f})")
-        
-        # Generate recommendations
-        if 'correlation_analysis' in self.analysis_results:
-            corr_data = self.analysis_results['correlation_analysis']
+            # Source insights; compare (name, rating) pairs rather than indexing in the key function
+            sources = corr_data.get('source_correlations')
+            if sources:
+                best_source, best_rating = max(
+                    ((name, stats['avg_rating']) for name, stats in sources.items()), key=itemgetter(1)
+                )
+                key_findings.append(f"Highest average rating from: {best_source} ({best_rating:.2f})")
             
             # Price category recommendations
-            if 'price_category_correlations' in corr_data:
-                categories = corr_data['price_category_correlations']
-                best_category = max(categories.items(), key=lambda x: x[1]['avg_rating'])
-                insights['recommendations'].append(f"Focus on {best_category[0]} category for best ratings")
-        
-        # Identify trends
-        if 'correlation_analysis' in self.analysis_results:
-            corr_data = self.analysis_results['correlation_analysis']
+            categories = corr_data.get('price_category_correlations')
+            if categories:
+                best_category, _ = max(
+                    ((name, stats['avg_rating']) for name, stats in categories.items()), key=itemgetter(1)
+                )
+                recommendations.append(f"Focus on {best_category} category for best ratings")
             
-            if 'time_series_correlations' in corr_data:
-                time_data = corr_data['time_series_correlations']
-                if 'time_correlations' in time_data:
-                    rating_trend = time_data['time_correlations'].get('rating_trend', {})
-                    if rating_trend.get('slope', 0) > 0:
-                        insights['trends'].append("Upward trend in ratings over time")
-                    elif rating_trend.get('slope', 0) < 0:
-                        insights['trends'].append("Downward trend in ratings over time")
+            # Identify trends
+            time_correlations = corr_data.get('time_series_correlations', {}).get('time_correlations')
+            if time_correlations is not None:
+                slope = time_correlations.get('rating_trend', {}).get('slope', 0)
+                if slope > 0:
+                    trends.append("Upward trend in ratings over time")
+                elif slope < 0:
+                    trends.append("Downward trend in ratings over time")
         
         self.analysis_results['insights_report'] = insights
         logger.info("Insights report generated")
@@ -230,22 +259,30 @@ class AutoIntelAnalyzer:
         # Save comprehensive results
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # Serialise the standalone sections once; the full results embed the same bytes
+        sections = {
+            key: _dump_json(self.analysis_results[key])
+            for key in ('insights_report', 'data_summary')
+            if key in self.analysis_results
+        }
+        
         # Save JSON results
         results_file = os.path.join(output_dir, f"analysis_results_{timestamp}.json")
-        with open(results_file, 'w') as f:
-            json.dump(self.analysis_results, f, indent=2, default=str)
+        full_results = {
+            key: orjson.Fragment(sections[key]) if key in sections else value
+            for key, value in self.analysis_results.items()
+        }
+        _write_bytes(results_file, _dump_json(full_results))
         
         # Save insights report
         insights_file = os.path.join(output_dir, f"insights_report_{timestamp}.json")
-        if 'insights_report' in self.analysis_results:
-            with open(insights_file, 'w') as f:
-                json.dump(self.analysis_results['insights_report'], f, indent=2)
+        if 'insights_report' in sections:
+            _write_bytes(insights_file, sections['insights_report'])
         
         # Save data summary
         summary_file = os.path.join(output_dir, f"data_summary_{timestamp}.json")
-        if 'data_summary' in self.analysis_results:
-            with open(summary_file, 'w') as f:
-                json.dump(self.analysis_results['data_summary'], f, indent=2, default=str)
+        if 'data_summary' in sections:
+            _write_bytes(summary_file, sections['data_summary'])
         
         logger.info(f"Analysis results saved to {output_dir}")
     
@@ -281,7 +318,8 @@ class AutoIntelAnalyzer:
         return summary
 
 
-def run_auto_intel_analysis(article_news_path: str, car_reviews_path: str, save_results: bool = True) -> Dict:
+def run_auto_intel_analysis(article_news_path: str, car_reviews_path: str, save_results: bool = True,
+                            summary_only: bool = False) -> Dict:
     """
     Run complete Auto Intel analysis pipeline
     
@@ -289,6 +327,7 @@ def run_auto_intel_analysis(article_news_path: str, car_reviews_path: str, save_
         article_news_path: Path to article news CSV file
         car_reviews_path: Path to car reviews CSV file
         save_results: Whether to save results to files
+        summary_only: Only compute the data summary, without preprocessing or analysis
         
     Returns:
         Complete analysis results
@@ -298,6 +337,12 @@ def run_auto_intel_analysis(article_news_path: str, car_reviews_path: str, save_
     # Initialize analyzer
     analyzer = AutoIntelAnalyzer(article_news_path, car_reviews_path)
     
+    if summary_only:
+        analyzer.run_data_summary()
+        if save_results:
+            analyzer.save_analysis_results()
+        return analyzer.analysis_results
+    
     # Run comprehensive analysis
     results = analyzer.run_comprehensive_analysis()
     
@@ -316,19 +361,31 @@ def run_auto_intel_analysis(article_news_path: str, car_reviews_path: str, save_
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run the Auto Intel analysis")
+    parser.add_argument('--summary-only', action='store_true', help="only summarise the raw data")
+    args = parser.parse_args()
+    
     # Test the main analyzer
     article_path = "project_data/article_news_202507212152.csv"
     reviews_path = "project_data/car_reviews_202507231630.csv"
     
     # Run analysis
-    results = run_auto_intel_analysis(article_path, reviews_path)
-    
-    print("Auto Intel Analysis Completed!")
-    print(f"Articles analyzed: {results['metadata']['total_articles']}")
-    print(f"Reviews analyzed: {results['metadata']['total_reviews']}")
+    results = run_auto_intel_analysis(article_path, reviews_path, summary_only=args.summary_only)
     
-    # Print key insights
-    if 'insights_report' in results:
-        print("\nKey Findings:")
-        for finding in results['insights_report']['key_findings']:
-            print(f"- {finding}")
+    if args.summary_only:
+        summary = results['data_summary']
+        print("Auto Intel Data Summary Completed!")
+        print(f"Articles: {summary['article_news']['total_records']}")
+        print(f"Reviews: {summary['car_reviews']['total_records']}")
+    else:
+        print("Auto Intel Analysis Completed!")
+        print(f"Articles analyzed: {results['metadata']['total_articles']}")
+        print(f"Reviews analyzed: {results['metadata']['total_reviews']}")
+        
+        # Print key insights
+        if 'insights_report' in results:
+            print("\nKey Findings:")
+            for finding in results['insights_report']['key_findings']:
+                print(f"- {finding}")
@@ -6,16 +6,20 @@ Handles Bigrams, Trigrams, Sentiment Analysis, and NER
 import pandas as pd
 import numpy as np
 from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
 import re
 import logging
-from typing import Dict, List, Tuple, Optional
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Tuple, Optional
 from datetime import datetime
 
 # NLP libraries
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.util import ngrams
+from nltk.tokenize import sent_tokenize
 from nltk.sentiment import SentimentIntensityAnalyzer
 import spacy
 from textblob import TextBlob
@@ -36,9 +40,14 @@ try:
 except LookupError:
     nltk.download('vader_lexicon')
 
-# Load spaCy model
+# Run spaCy on a CUDA GPU when one is usable (needs cupy); falls back to CPU otherwise.
+# Must happen before the model is loaded
+SPACY_GPU = spacy.prefer_gpu()
+
+# Load spaCy model; only doc.ents is used, so keep just tok2vec and NER running.
+# Disabled components stay loaded and can be re-enabled with nlp.select_pipes(enable=[...])
 try:
-    nlp = spacy.load("en_core_web_sm")
+    nlp = spacy.load("en_core_web_sm", disable=["tagger", "parser", "attribute_ruler", "lemmatizer"])
 except OSError:
     print("spaCy model not found. Please install: python -m spacy download en_core_web_sm")
     nlp = None
@@ -47,29 +56,138 @@ except OSError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Below this many texts, worker start-up costs more than serial VADER scoring
+PARALLEL_SENTIMENT_MIN_TEXTS = 2000
+
+# Below this many texts, pickling partial Counters back costs more than counting serially
+PARALLEL_NGRAM_MIN_TEXTS = 2000
+
+SENTIMENT_KEYS = ['compound', 'pos', 'neg', 'neu']
+
+# Patterns used on every text in preprocess_text, compiled once
+_NON_ALPHA_RE = re.compile(r"[^a-zA-Z\s']")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Texts per spaCy nlp.pipe batch when extracting entities; larger on GPU to keep it busy
+ENTITY_BATCH_SIZE = 256 if SPACY_GPU else 64
+
+# Per-review compound sentiment, cached off the frame so its columns, fingerprint and API
+# output stay unchanged; keyed by frame id, shared by every NLPAnalyzer, dropped with the frame
+SENTIMENT_COLUMN = 'sentiment_score'
+_review_sentiment_cache: Dict[int, Tuple[weakref.ref, pd.Series]] = {}
+
+# Scraped corpora repeat titles and stock phrases, and VADER is deterministic,
+# so scores are memoized per distinct text
+VADER_CACHE_SIZE = 100_000
+
+# English stop words plus automotive-specific ones
+STOP_WORDS = frozenset(stopwords.words('english')).union([
+    'car', 'cars', 'vehicle', 'vehicles', 'review', 'reviews',
+    'test', 'testing', 'drive', 'driving', 'road', 'roads'
+])
+
+# Automotive brands and models for NER
+CAR_BRANDS = frozenset({
+    'bmw', 'mercedes', 'audi', 'volkswagen', 'volvo', 'porsche',
+    'ferrari', 'lamborghini', 'toyota', 'honda', 'ford', 'chevrolet',
+    'nissan', 'hyundai', 'kia', 'mazda', 'subaru', 'lexus', 'infiniti',
+    'acura', 'buick', 'cadillac', 'chrysler', 'dodge', 'jeep', 'ram',
+    'tesla', 'rivian', 'lucid', 'polestar', 'nio', 'xpeng', 'li auto'
+})
+
+# One alternation over all brands, longest first, matched on word boundaries
+CAR_BRAND_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(sorted(map(re.escape, CAR_BRANDS), key=len, reverse=True)) + r')\b'
+)
+
+# Per-process memoized VADER scorer for sentiment worker processes
+_worker_polarity_scores = None
+
+
+def _worker_scorer():
+    """Memoized VADER scorer for the current worker process, built on first use"""
+    global _worker_polarity_scores
+    if _worker_polarity_scores is None:
+        _worker_polarity_scores = lru_cache(maxsize=VADER_CACHE_SIZE)(SentimentIntensityAnalyzer().polarity_scores)
+    return _worker_polarity_scores
+
+
+def _compound_scores(texts: List[str]) -> List[float]:
+    """Score one chunk of texts in a worker process, building VADER once per process"""
+    polarity_scores = _worker_scorer()
+    return [polarity_scores(text)['compound'] if text else 0 for text in texts]
+
+
+def _sentiment_totals(texts: List[str]) -> Tuple[np.ndarray, int]:
+    """Sum the VADER scores of one chunk of texts in a worker process"""
+    polarity_scores = _worker_scorer()
+    totals = np.zeros(len(SENTIMENT_KEYS))
+    for text in texts:
+        scores = polarity_scores(text)
+        totals += [scores[key] for key in SENTIMENT_KEYS]
+    return totals, len(texts)
+
+
+def _clean_text(text: str) -> str:
+    """Lowercase text, keep only letters and apostrophes, and collapse whitespace"""
+    if pd.isna(text) or text == '':
+        return ''
+        
+    # Convert to lowercase
+    text = text.lower()
+    
+    # Remove special characters but keep apostrophes
+    text = _NON_ALPHA_RE.sub(' ', text)
+    
+    # Remove extra whitespace
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def _text_ngrams(text: str, n: int, stop_words: frozenset) -> Iterator[Tuple[str, ...]]:
+    """Lazily generate the n-grams of text after cleaning and stop-word removal"""
+    if not text:
+        return iter(())
+    
+    # Tokenize; cleaning leaves only letters, apostrophes and single spaces
+    tokens = [token for token in _clean_text(text).split() if token not in stop_words and len(token) > 2]
+    
+    # Generate n-grams from n staggered views of the tokens
+    return zip(*(tokens[i:] for i in range(n)))
+
+
+def _count_ngram_chunk(args: Tuple[List[str], int, frozenset]) -> Counter:
+    """Count the n-grams of one chunk of texts in a single C-level Counter pass"""
+    texts, n, stop_words = args
+    return Counter(chain.from_iterable(_text_ngrams(text, n, stop_words) for text in texts))
+
+
+def _mean_length(df: pd.DataFrame, column: str) -> float:
+    """Mean character length of a text column, reusing its preprocessed length column if present"""
+    length_column = f'{column}_length'
+    if length_column in df.columns:
+        return df[length_column].astype('float64').mean()
+    return df[column].str.len().mean()
+
+
+def _split_evenly(texts: List[str], parts: int) -> List[List[str]]:
+    """Split texts into at most parts contiguous, similarly sized chunks"""
+    size = -(-len(texts) // parts)
+    return [texts[i:i + size] for i in range(0, len(texts), size)]
+
 
 class NLPAnalyzer:
     """NLP Analysis for automotive text data"""
     
     def __init__(self):
         """Initialize NLP analyzer with required components"""
-        self.stop_words = set(stopwords.words('english'))
-        self.sia = SentimentIntensityAnalyzer()
+        # Shared, immutable vocabularies built once at import
+        self.stop_words = STOP_WORDS
+        self.car_brands = CAR_BRANDS
+        self.car_brand_pattern = CAR_BRAND_PATTERN
         
-        # Add automotive-specific stop words
-        self.stop_words.update([
-            'car', 'cars', 'vehicle', 'vehicles', 'review', 'reviews',
-            'test', 'testing', 'drive', 'driving', 'road', 'roads'
-        ])
-        
-        # Automotive brands and models for NER
-        self.car_brands = {
-            'bmw', 'mercedes', 'audi', 'volkswagen', 'volvo', 'porsche',
-            'ferrari', 'lamborghini', 'toyota', 'honda', 'ford', 'chevrolet',
-            'nissan', 'hyundai', 'kia', 'mazda', 'subaru', 'lexus', 'infiniti',
-            'acura', 'buick', 'cadillac', 'chrysler', 'dodge', 'jeep', 'ram',
-            'tesla', 'rivian', 'lucid', 'polestar', 'nio', 'xpeng', 'li auto'
-        }
+        self.sia = SentimentIntensityAnalyzer()
+        # Shared cached score dicts; callers must not mutate them
+        self._polarity_scores = lru_cache(maxsize=VADER_CACHE_SIZE)(self.sia.polarity_scores)
         
     def preprocess_text(self, text: str) -> str:
         """
@@ -81,19 +199,7 @@ class NLPAnalyzer:
         Returns:
             Preprocessed text
         """
-        if pd.isna(text) or text == '':
-            return ''
-            
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters but keep apostrophes
-        text = re.sub(r'[^a-zA-Z\s\']', ' ', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return _clean_text(text)
     
     def extract_ngrams(self, text: str, n: int = 2, top_k: int = 20) -> List[Tuple[str, int]]:
         """
@@ -107,26 +213,33 @@ class NLPAnalyzer:
         Returns:
             List of (ngram, count) tuples
         """
-        if not text:
-            return []
-            
-        # Preprocess text
-        processed_text = self.preprocess_text(text)
-        
-        # Tokenize
-        tokens = word_tokenize(processed_text)
-        
-        # Remove stop words
-        tokens = [token for token in tokens if token not in self.stop_words and len(token) > 2]
-        
-        # Generate n-grams
-        ngram_list = list(ngrams(tokens, n))
+        return self._count_ngrams(text, n).most_common(top_k)
+    
+    def _count_ngrams(self, text: str, n: int) -> Counter:
+        """
+        Count every n-gram in text, without truncating to the most common
         
-        # Count n-grams
-        ngram_counts = Counter(ngram_list)
+        Args:
+            text: Input text
+            n: N-gram size
+            
+        Returns:
+            Counter of n-gram tuples
+        """
+        return Counter(self._ngrams(text, n))
+    
+    def _ngrams(self, text: str, n: int) -> Iterator[Tuple[str, ...]]:
+        """
+        Lazily generate the n-grams of text after preprocessing and stop-word removal
         
-        # Return top k n-grams
-        return ngram_counts.most_common(top_k)
+        Args:
+            text: Input text
+            n: N-gram size
+            
+        Returns:
+            Iterator of n-gram tuples
+        """
+        return _text_ngrams(text, n, self.stop_words)
     
     def analyze_sentiment(self, text: str) -> Dict[str, float]:
         """
@@ -141,11 +254,54 @@ class NLPAnalyzer:
         if not text:
             return {'compound': 0, 'pos': 0, 'neg': 0, 'neu': 0}
             
-        # Get VADER sentiment scores
-        scores = self.sia.polarity_scores(text)
+        # Get VADER sentiment scores; copied so callers cannot alter the cached entry
+        scores = dict(self._polarity_scores(text))
         
         return scores
     
+    def analyze_sentiment_batch(self, texts: List[str], max_workers: Optional[int] = None,
+                                chunksize: int = 256) -> List[float]:
+        """
+        Compound sentiment scores for many texts, spread across processes for large corpora
+        
+        Args:
+            texts: Input texts
+            max_workers: Worker processes (defaults to the CPU count)
+            chunksize: Texts scored per worker task
+            
+        Returns:
+            List of compound scores in input order
+        """
+        if len(texts) < PARALLEL_SENTIMENT_MIN_TEXTS:
+            return [self._polarity_scores(text)['compound'] if text else 0 for text in texts]
+        
+        chunks = [texts[i:i + chunksize] for i in range(0, len(texts), chunksize)]
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return [score for chunk in executor.map(_compound_scores, chunks) for score in chunk]
+    
+    def review_sentiment(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Per-review compound sentiment of the verdicts, computed once per frame
+        
+        Args:
+            df: Car reviews DataFrame; left unmodified
+            
+        Returns:
+            Compound scores aligned with df (NaN where the verdict is missing)
+        """
+        key = id(df)
+        cached = _review_sentiment_cache.get(key)
+        if cached is not None and cached[0]() is df:
+            return cached[1]
+        
+        has_verdict = df['verdict'].notna().to_numpy(dtype=bool)
+        values = np.full(len(df), np.nan)
+        values[has_verdict] = self.analyze_sentiment_batch(df['verdict'][has_verdict].tolist())
+        scores = pd.Series(values, index=df.index, name=SENTIMENT_COLUMN)
+        frame_ref = weakref.ref(df, lambda _: _review_sentiment_cache.pop(key, None))
+        _review_sentiment_cache[key] = (frame_ref, scores)
+        return scores
+    
     def get_sentiment_label(self, compound_score: float) -> str:
         """
         Convert compound sentiment score to label
@@ -173,21 +329,41 @@ class NLPAnalyzer:
         Returns:
             Dictionary with entity types and values
         """
-        if not nlp or not text:
-            return {}
+        return self.extract_entities_batch([text])[0]
+    
+    def extract_entities_batch(self, texts: List[str], batch_size: int = ENTITY_BATCH_SIZE,
+                               n_process: int = 1) -> List[Dict[str, List[str]]]:
+        """
+        Extract named entities from many texts with a single batched spaCy pass
+        
+        Args:
+            texts: Input texts
+            batch_size: Texts per nlp.pipe batch
+            n_process: spaCy worker processes; one avoids start-up costs on small samples
             
-        doc = nlp(text)
-        entities = defaultdict(list)
+        Returns:
+            One dictionary of entity types and values per text, in input order
+        """
+        results = [{} for _ in texts]
+        if not nlp:
+            return results
         
-        for ent in doc.ents:
-            entities[ent.label_].append(ent.text)
+        positions = [i for i, text in enumerate(texts) if text]
+        docs = nlp.pipe((texts[i] for i in positions), batch_size=batch_size, n_process=n_process)
         
-        # Extract car brands and models
-        car_entities = self.extract_car_entities(text)
-        if car_entities:
-            entities['CAR_BRAND'] = car_entities
+        for i, doc in zip(positions, docs):
+            entities = defaultdict(list)
+            for ent in doc.ents:
+                entities[ent.label_].append(ent.text)
+            
+            # Extract car brands and models
+            car_entities = self.extract_car_entities(texts[i])
+            if car_entities:
+                entities['CAR_BRAND'] = car_entities
+            
+            results[i] = dict(entities)
         
-        return dict(entities)
+        return results
     
     def extract_car_entities(self, text: str) -> List[str]:
         """
@@ -202,67 +378,70 @@ class NLPAnalyzer:
         if not text:
             return []
             
-        text_lower = text.lower()
-        found_brands = []
-        
-        for brand in self.car_brands:
-            if brand in text_lower:
-                found_brands.append(brand.title())
+        # A single scan of the text; dict.fromkeys drops repeats and keeps first-seen order
+        found_brands = dict.fromkeys(self.car_brand_pattern.findall(text.lower()))
         
-        return found_brands
+        return [brand.title() for brand in found_brands]
     
-    def analyze_corpus_ngrams(self, texts: List[str], n: int = 2, top_k: int = 50) -> List[Tuple[str, int]]:
+    def analyze_corpus_ngrams(self, texts: List[str], n: int = 2, top_k: int = 50,
+                              max_workers: Optional[int] = None) -> List[Tuple[str, int]]:
         """
-        Analyze n-grams across entire corpus
+        Analyze n-grams across entire corpus, spread across processes for large corpora
         
         Args:
             texts: List of text documents
             n: N-gram size
             top_k: Number of top n-grams to return
+            max_workers: Worker processes (defaults to the CPU count)
             
         Returns:
             List of (ngram, count) tuples
         """
-        all_ngrams = []
+        valid_texts = [text for text in texts if text and not pd.isna(text)]
         
-        for text in texts:
-            if text and not pd.isna(text):
-                ngrams = self.extract_ngrams(text, n, top_k)
-                all_ngrams.extend(ngrams)
-        
-        # Count across all documents
-        corpus_counts = Counter()
-        for ngram, count in all_ngrams:
-            corpus_counts[ngram] += count
+        # Count full per-document n-grams so the corpus top-k sees the long tail; chaining
+        # the documents into one Counter keeps the whole count in its C-level loop
+        if len(valid_texts) < PARALLEL_NGRAM_MIN_TEXTS:
+            corpus_counts = _count_ngram_chunk((valid_texts, n, self.stop_words))
+        else:
+            # Chunks are contiguous and merged in order, so ties keep first-occurrence order
+            chunks = _split_evenly(valid_texts, max_workers or os.cpu_count())
+            corpus_counts = Counter()
+            with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                for partial_counts in executor.map(_count_ngram_chunk, [(chunk, n, self.stop_words) for chunk in chunks]):
+                    corpus_counts.update(partial_counts)
         
         return corpus_counts.most_common(top_k)
     
-    def analyze_corpus_sentiment(self, texts: List[str]) -> Dict[str, float]:
+    def analyze_corpus_sentiment(self, texts: List[str], max_workers: Optional[int] = None) -> Dict[str, float]:
         """
-        Analyze sentiment across entire corpus
+        Analyze sentiment across entire corpus, spread across processes for large corpora
         
         Args:
             texts: List of text documents
+            max_workers: Worker processes (defaults to the CPU count)
             
         Returns:
             Dictionary with average sentiment scores
         """
-        all_scores = []
-        
-        for text in texts:
-            if text and not pd.isna(text):
-                scores = self.analyze_sentiment(text)
-                all_scores.append(scores)
+        valid_texts = [text for text in texts if text and not pd.isna(text)]
         
-        if not all_scores:
+        if not valid_texts:
             return {'compound': 0, 'pos': 0, 'neg': 0, 'neu': 0}
         
-        # Calculate average scores
-        avg_scores = {}
-        for key in ['compound', 'pos', 'neg', 'neu']:
-            avg_scores[key] = np.mean([score[key] for score in all_scores])
+        if len(valid_texts) < PARALLEL_SENTIMENT_MIN_TEXTS:
+            # One frame of scores, averaged column-wise in a single pass
+            scores = pd.DataFrame(map(self._polarity_scores, valid_texts), columns=SENTIMENT_KEYS)
+            return scores.mean().to_dict()
         
-        return avg_scores
+        # Workers return per-chunk score sums and counts, combined into one average
+        chunks = _split_evenly(valid_texts, max_workers or os.cpu_count())
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            partials = list(executor.map(_sentiment_totals, chunks))
+        totals = sum(partial_totals for partial_totals, _ in partials)
+        count = sum(partial_count for _, partial_count in partials)
+        
+        return dict(zip(SENTIMENT_KEYS, (totals / count).tolist()))
     
     def analyze_article_news(self, df: pd.DataFrame) -> Dict:
         """
@@ -293,8 +472,7 @@ class NLPAnalyzer:
         # Extract entities from sample texts
         sample_contents = contents[:100]  # Sample for performance
         entities = defaultdict(list)
-        for content in sample_contents:
-            content_entities = self.extract_entities(content)
+        for content_entities in self.extract_entities_batch(sample_contents):
             for entity_type, entity_list in content_entities.items():
                 entities[entity_type].extend(entity_list)
         
@@ -318,8 +496,8 @@ class NLPAnalyzer:
             'entities': dict(entities),
             'summary': {
                 'total_articles': len(df),
-                'avg_title_length': df['title'].str.len().mean(),
-                'avg_content_length': df['content'].str.len().mean()
+                'avg_title_length': _mean_length(df, 'title'),
+                'avg_content_length': _mean_length(df, 'content')
             }
         }
         
@@ -355,8 +533,7 @@ class NLPAnalyzer:
         # Extract entities from sample texts
         sample_verdicts = verdicts[:100]  # Sample for performance
         entities = defaultdict(list)
-        for verdict in sample_verdicts:
-            verdict_entities = self.extract_entities(verdict)
+        for verdict_entities in self.extract_entities_batch(sample_verdicts):
             for entity_type, entity_list in verdict_entities.items():
                 entities[entity_type].extend(entity_list)
         
@@ -384,10 +561,10 @@ class NLPAnalyzer:
             'correlation_analysis': sentiment_correlation,
             'summary': {
                 'total_reviews': len(df),
-                'avg_rating': df['rating'].mean(),
-                'avg_price': df['price'].mean(),
-                'avg_title_length': df['title'].str.len().mean(),
-                'avg_verdict_length': df['verdict'].str.len().mean()
+                'avg_rating': float(df['rating'].mean()),
+                'avg_price': float(df['price'].mean()),
+                'avg_title_length': _mean_length(df, 'title'),
+                'avg_verdict_length': _mean_length(df, 'verdict')
             }
         }
         
@@ -406,21 +583,14 @@ class NLPAnalyzer:
         """
         correlations = {}
         
-        # Calculate sentiment scores for each review
-        sentiment_scores = []
-        for verdict in df['verdict'].dropna():
-            scores = self.analyze_sentiment(verdict)
-            sentiment_scores.append(scores['compound'])
-        
-        # Add sentiment scores to dataframe
-        df_with_sentiment = df.copy()
-        df_with_sentiment['sentiment_score'] = sentiment_scores
+        # Sentiment scores for each review, reused if an earlier pass computed them
+        sentiment = self.review_sentiment(df)
         
         # Calculate correlations
-        if len(sentiment_scores) > 0:
-            correlations['sentiment_rating'] = df_with_sentiment['sentiment_score'].corr(df_with_sentiment['rating'])
-            correlations['sentiment_price'] = df_with_sentiment['sentiment_score'].corr(df_with_sentiment['price'])
-            correlations['rating_price'] = df_with_sentiment['rating'].corr(df_with_sentiment['price'])
+        if sentiment.notna().any():
+            correlations['sentiment_rating'] = sentiment.corr(df['rating'])
+            correlations['sentiment_price'] = sentiment.corr(df['price'])
+            correlations['rating_price'] = df['rating'].corr(df['price'])
         
         return correlations
 
@@ -7,8 +7,14 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import pandas as pd
+import numpy as np
+import orjson
+import asyncio
 import json
 import os
+import re
+import hashlib
+import pickle
 import sys
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -18,17 +24,24 @@ import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from analysis.main_analyzer import AutoIntelAnalyzer
-from analysis.data_loader import DataLoader
+from analysis.data_loader import DataLoader, top_counts
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Auto Intel API",
     description="API for accessing automotive data analysis results",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -43,24 +56,76 @@ app.add_middleware(
 # Global variables for caching
 analyzer = None
 analysis_results = None
-data_loaded = False
+
+# Set once the background load has finished; endpoints wait on it instead of blocking the loop
+_ready = asyncio.Event()
+_load_task: Optional[asyncio.Task] = None
+READY_TIMEOUT_SECONDS = float(os.getenv('ANALYSIS_READY_TIMEOUT', '30'))
+
+ARTICLE_NEWS_PATH = 'project_data/article_news_202507212152.csv'
+CAR_REVIEWS_PATH = 'project_data/car_reviews_202507231630.csv'
+
+# Analysis results persisted across restarts, keyed on the input files
+RESULTS_CACHE_DIR = os.getenv('ANALYSIS_CACHE_DIR', 'cache')
+
+def _results_cache_path() -> Optional[str]:
+    """Cache file for the current inputs, keyed on their path, size and mtime"""
+    try:
+        stats = [os.stat(path) for path in (ARTICLE_NEWS_PATH, CAR_REVIEWS_PATH)]
+    except OSError:
+        return None
+    fingerprint = [(path, stat.st_size, stat.st_mtime_ns) for path, stat in zip((ARTICLE_NEWS_PATH, CAR_REVIEWS_PATH), stats)]
+    key = hashlib.sha256(repr(fingerprint).encode()).hexdigest()
+    return os.path.join(RESULTS_CACHE_DIR, f"analysis_results_{key}.pkl")
+
+def _load_cached_results(cache_path: Optional[str]) -> Optional[Dict]:
+    """Previously computed results for unchanged inputs, if any"""
+    if cache_path is None or not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable analysis cache {cache_path}: {e}")
+        return None
+
+def _save_cached_results(cache_path: Optional[str], results: Dict) -> None:
+    """Persist results atomically so a partial write is never read back"""
+    if cache_path is None:
+        return
+    try:
+        os.makedirs(RESULTS_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write analysis cache {cache_path}: {e}")
 
 def load_data_and_analyze():
-    """Load data and run analysis"""
-    global analyzer, analysis_results, data_loaded
+    """Load data and run analysis, reusing cached results when the inputs are unchanged"""
+    global analyzer, analysis_results
     
-    if data_loaded:
+    if analysis_results is not None:
         return
     
     try:
-        logger.info("Loading data and running analysis...")
-        
-        # Initialize analyzer
+        # Initialize analyzer; its frames load lazily, so a cache hit reads no data
         analyzer = AutoIntelAnalyzer(
-            article_news_path='project_data/article_news_202507212152.csv',
-            car_reviews_path='project_data/car_reviews_202507231630.csv'
+            article_news_path=ARTICLE_NEWS_PATH,
+            car_reviews_path=CAR_REVIEWS_PATH
         )
         
+        cache_path = _results_cache_path()
+        cached_results = _load_cached_results(cache_path)
+        if cached_results is not None:
+            logger.info(f"Loaded analysis results from {cache_path}")
+            analyzer.analysis_results = cached_results
+            analysis_results = cached_results
+            return
+        
+        logger.info("Loading data and running analysis...")
+        
         # Run comprehensive analysis
         analysis_results = analyzer.run_comprehensive_analysis()
         
@@ -68,17 +133,56 @@ def load_data_and_analyze():
         insights = analyzer.generate_insights_report()
         analysis_results['insights_report'] = insights
         
-        data_loaded = True
+        _save_cached_results(cache_path, analysis_results)
+        
         logger.info("Data loaded and analysis completed")
         
     except Exception as e:
         logger.error(f"Error loading data: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to load data: {str(e)}")
 
+def _prepare_frames() -> None:
+    """Load the processed frames and build their search indexes before any request needs them"""
+    try:
+        article_df = analyzer.processed_article_df
+        if article_df is not None:
+            _search_index(article_df, 'content')
+        review_df = analyzer.processed_reviews_df
+        if review_df is not None:
+            _search_index(review_df, 'verdict')
+    except Exception as e:
+        # The endpoints load the frames themselves and report the error there
+        logger.warning(f"Could not prepare data frames: {e}")
+
+async def _load_in_background() -> None:
+    """Run the blocking load in a worker thread and signal readiness"""
+    await asyncio.to_thread(load_data_and_analyze)
+    # A results-cache hit reads no data; the frames are loaded here rather than in a handler
+    await asyncio.to_thread(_prepare_frames)
+    _ready.set()
+
+def _start_loading() -> asyncio.Task:
+    """Start the background load unless one is running or has succeeded; retry after a failure"""
+    global _load_task
+    if _load_task is None or (_load_task.done() and not _ready.is_set()):
+        _load_task = asyncio.create_task(_load_in_background())
+        # Mark failures as retrieved; endpoints awaiting the task still see them
+        _load_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+    return _load_task
+
+async def _wait_until_ready() -> None:
+    """Wait for the analysis to be available without blocking the event loop"""
+    if _ready.is_set():
+        return
+    try:
+        await asyncio.wait_for(asyncio.shield(_start_loading()), timeout=READY_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="Analysis is still running, please retry shortly")
+
 @app.on_event("startup")
 async def startup_event():
-    """Initialize data on startup"""
-    load_data_and_analyze()
+    """Start loading data in the background so the server accepts requests immediately"""
+    _start_loading()
 
 @app.get("/")
 async def root():
@@ -104,14 +208,13 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "data_loaded": data_loaded
+        "data_loaded": _ready.is_set()
     }
 
 @app.get("/summary")
 async def get_summary():
     """Get analysis summary"""
-    if not data_loaded:
-        load_data_and_analyze()
+    await _wait_until_ready()
     
     if analysis_results is None:
         raise HTTPException(status_code=500, detail="Analysis results not available")
@@ -122,8 +225,7 @@ async def get_summary():
 @app.get("/data")
 async def get_data_summary():
     """Get data summary"""
-    if not data_loaded:
-        load_data_and_analyze()
+    await _wait_until_ready()
     
     if analysis_results is None:
         raise HTTPException(status_code=500, detail="Analysis results not available")
@@ -133,8 +235,7 @@ async def get_data_summary():
 @app.get("/nlp")
 async def get_nlp_results():
     """Get NLP analysis results"""
-    if not data_loaded:
-        load_data_and_analyze()
+    await _wait_until_ready()
     
     if analysis_results is None:
         raise HTTPException(status_code=500, detail="Analysis results not available")
@@ -159,8 +260,7 @@ async def get_nlp_results():
 @app.get("/correlations")
 async def get_correlation_results():
     """Get correlation analysis results"""
-    if not data_loaded:
-        load_data_and_analyze()
+    await _wait_until_ready()
     
     if analysis_results is None:
         raise HTTPException(status_code=500, detail="Analysis results not available")
@@ -180,19 +280,37 @@ async def get_correlation_results():
 @app.get("/insights")
 async def get_insights():
     """Get insights report"""
-    if not data_loaded:
-        load_data_and_analyze()
+    await _wait_until_ready()
     
     if analysis_results is None:
         raise HTTPException(status_code=500, detail="Analysis results not available")
     
     return analysis_results.get('insights_report', {})
 
+def _widen_float32(df: pd.DataFrame) -> pd.DataFrame:
+    """Widen float32 columns through their shortest repr, so a rating of 3.2 is served as 3.2 rather than 3.200000047683716"""
+    narrow = df.columns[df.dtypes == np.float32]
+    if narrow.empty:
+        return df
+    return df.astype({column: str for column in narrow}).astype({column: np.float64 for column in narrow})
+
+def _float32_value(value) -> float:
+    """A float32 column's aggregate at the precision it was stored with, as _widen_float32 does per row"""
+    return float(str(np.float32(value)))
+
+def _records_response(df: pd.DataFrame, limit: int = 100) -> ORJSONResponse:
+    """Serialise the first rows with pandas' C encoder and splice them into the response"""
+    records = _widen_float32(df.head(limit)).to_json(orient='records', date_format='iso', date_unit='s')
+    return ORJSONResponse({
+        "data": orjson.Fragment(records),
+        "total_rows": len(df),
+        "columns": list(df.columns)
+    })
+
 @app.get("/raw-data/{data_type}")
 async def get_raw_data(data_type: str):
     """Get raw data (limited for API)"""
-    if not data_loaded:
-        load_data_and_analyze()
+    await _wait_until_ready()
     
     if analyzer is None:
         raise HTTPException(status_code=500, detail="Analyzer not available")
@@ -203,11 +321,7 @@ async def get_raw_data(data_type: str):
             raise HTTPException(status_code=404, detail="Article data not available")
         
         # Return first 100 rows for API
-        return {
-            "data": df.head(100).to_dict('records'),
-            "total_rows": len(df),
-            "columns": list(df.columns)
-        }
+        return _records_response(df)
     
     elif data_type == "reviews":
         df = analyzer.processed_reviews_df
@@ -215,11 +329,7 @@ async def get_raw_data(data_type: str):
             raise HTTPException(status_code=404, detail="Review data not available")
         
         # Return first 100 rows for API
-        return {
-            "data": df.head(100).to_dict('records'),
-            "total_rows": len(df),
-            "columns": list(df.columns)
-        }
+        return _records_response(df)
     
     else:
         raise HTTPException(status_code=400, detail="Invalid data type. Use 'articles' or 'reviews'")
@@ -227,8 +337,7 @@ async def get_raw_data(data_type: str):
 @app.get("/stats/{data_type}")
 async def get_statistics(data_type: str):
     """Get statistics for a specific data type"""
-    if not data_loaded:
-        load_data_and_analyze()
+    await _wait_until_ready()
     
     if analyzer is None:
         raise HTTPException(status_code=500, detail="Analyzer not available")
@@ -244,7 +353,7 @@ async def get_statistics(data_type: str):
                 "start": df['publication_date'].min().isoformat() if not df['publication_date'].isna().all() else None,
                 "end": df['publication_date'].max().isoformat() if not df['publication_date'].isna().all() else None
             },
-            "sources": df['source'].value_counts().to_dict(),
+            "sources": top_counts(df['source']),
             "avg_title_length": df['title_length'].mean(),
             "avg_content_length": df['content_length'].mean()
         }
@@ -262,14 +371,17 @@ async def get_statistics(data_type: str):
                 "start": df['publication_date'].min().isoformat() if not df['publication_date'].isna().all() else None,
                 "end": df['publication_date'].max().isoformat() if not df['publication_date'].isna().all() else None
             },
-            "sources": df['source'].value_counts().to_dict(),
-            "avg_rating": df['rating'].mean(),
-            "avg_price": df['price'].mean(),
+            "sources": top_counts(df['source']),
+            "avg_rating": _float32_value(df['rating'].mean()),
+            "avg_price": _float32_value(df['price'].mean()),
             "price_range": {
-                "min": df['price'].min(),
-                "max": df['price'].max()
+                "min": _float32_value(df['price'].min()),
+                "max": _float32_value(df['price'].max())
             },
-            "rating_distribution": df['rating'].value_counts().sort_index().to_dict()
+            "rating_distribution": {
+                _float32_value(rating): count
+                for rating, count in df['rating'].value_counts().sort_index().items()
+            }
         }
         
         return stats
@@ -277,11 +389,69 @@ async def get_statistics(data_type: str):
     else:
         raise HTTPException(status_code=400, detail="Invalid data type. Use 'articles' or 'reviews'")
 
+class _SearchIndex:
+    """Inverted index from word tokens to row positions over a frame's lowercased title and body"""
+    
+    TOKEN_PATTERN = r'\w+'
+    
+    def __init__(self, df: pd.DataFrame, text_column: str):
+        self.df = df
+        self.search_text = (df['title'].fillna('') + ' ' + df[text_column].fillna('')).str.lower()
+        
+        # One (token, row) pair per distinct token in a row, grouped by token
+        tokens = pd.Series(self.search_text.to_numpy()).str.findall(self.TOKEN_PATTERN).explode().dropna()
+        pairs = pd.DataFrame({'token': tokens.to_numpy(dtype=object), 'row': tokens.index.to_numpy()}).drop_duplicates()
+        codes, vocabulary = pd.factorize(pairs['token'])
+        order = np.argsort(codes, kind='stable')
+        self.vocabulary = pd.Series(vocabulary, dtype='string[pyarrow]')
+        self.rows = pairs['row'].to_numpy()[order]
+        self.offsets = np.searchsorted(codes[order], np.arange(len(vocabulary) + 1))
+    
+    def candidates(self, needle: str) -> Optional[np.ndarray]:
+        """Sorted row positions that may contain needle, or None when the index cannot narrow it"""
+        # Every word run of the query is a substring of some token of a matching row
+        query_tokens = set(re.findall(self.TOKEN_PATTERN, needle))
+        if not query_tokens:
+            return None
+        
+        rows = None
+        for query_token in query_tokens:
+            token_ids = np.flatnonzero(self.vocabulary.str.contains(query_token, regex=False).to_numpy(dtype=bool))
+            postings = [self.rows[self.offsets[i]:self.offsets[i + 1]] for i in token_ids]
+            token_rows = np.unique(np.concatenate(postings)) if postings else np.empty(0, dtype=self.rows.dtype)
+            rows = token_rows if rows is None else np.intersect1d(rows, token_rows, assume_unique=True)
+            if not len(rows):
+                break
+        return rows
+
+# Search indexes per dataset, built on the first search and reused
+_search_indexes: Dict[str, _SearchIndex] = {}
+
+def _search_index(df: pd.DataFrame, text_column: str) -> _SearchIndex:
+    """Index for df, rebuilt only if the analyzer's frame changed"""
+    index = _search_indexes.get(text_column)
+    if index is None or index.df is not df:
+        index = _search_indexes[text_column] = _SearchIndex(df, text_column)
+    return index
+
+def _search_matches(df: pd.DataFrame, text_column: str, query: str) -> tuple:
+    """Rows whose title, and rows whose body, contain query case-insensitively"""
+    # The index narrows the rows to scan; the literal check then runs on those only
+    needle = query.lower()
+    index = _search_index(df, text_column)
+    rows = index.candidates(needle)
+    if rows is None:
+        rows = np.arange(len(df))
+    hits = index.search_text.iloc[rows].str.contains(needle, regex=False).to_numpy(dtype=bool)
+    candidates = df.iloc[rows[hits]]
+    title_hits = candidates['title'].str.lower().str.contains(needle, regex=False, na=False)
+    text_hits = candidates[text_column].str.lower().str.contains(needle, regex=False, na=False)
+    return candidates[title_hits.to_numpy(dtype=bool)], candidates[text_hits.to_numpy(dtype=bool)]
+
 @app.get("/search")
 async def search_data(query: str, data_type: str = "both", limit: int = 10):
     """Search data by title or content"""
-    if not data_loaded:
-        load_data_and_analyze()
+    await _wait_until_ready()
     
     if analyzer is None:
         raise HTTPException(status_code=500, detail="Analyzer not available")
@@ -292,24 +462,23 @@ async def search_data(query: str, data_type: str = "both", limit: int = 10):
         article_df = analyzer.processed_article_df
         if article_df is not None:
             # Search in titles and content
-            title_matches = article_df[article_df['title'].str.contains(query, case=False, na=False)]
-            content_matches = article_df[article_df['content'].str.contains(query, case=False, na=False)]
+            title_matches, content_matches = _search_matches(article_df, 'content', query)
             
-            for _, row in title_matches.head(limit//2).iterrows():
+            for row in title_matches.head(limit//2).itertuples(index=False):
                 results.append({
                     "type": "article",
-                    "title": row['title'],
-                    "source": row['source'],
-                    "publication_date": row['publication_date'].isoformat() if pd.notna(row['publication_date']) else None,
+                    "title": row.title,
+                    "source": row.source,
+                    "publication_date": row.publication_date.isoformat() if pd.notna(row.publication_date) else None,
                     "match_type": "title"
                 })
             
-            for _, row in content_matches.head(limit//2).iterrows():
+            for row in content_matches.head(limit//2).itertuples(index=False):
                 results.append({
                     "type": "article",
-                    "title": row['title'],
-                    "source": row['source'],
-                    "publication_date": row['publication_date'].isoformat() if pd.notna(row['publication_date']) else None,
+                    "title": row.title,
+                    "source": row.source,
+                    "publication_date": row.publication_date.isoformat() if pd.notna(row.publication_date) else None,
                     "match_type": "content"
                 })
     
@@ -317,28 +486,27 @@ async def search_data(query: str, data_type: str = "both", limit: int = 10):
         review_df = analyzer.processed_reviews_df
         if review_df is not None:
             # Search in titles and verdicts
-            title_matches = review_df[review_df['title'].str.contains(query, case=False, na=False)]
-            verdict_matches = review_df[review_df['verdict'].str.contains(query, case=False, na=False)]
+            title_matches, verdict_matches = _search_matches(review_df, 'verdict', query)
             
-            for _, row in title_matches.head(limit//2).iterrows():
+            for row in _widen_float32(title_matches.head(limit//2)).itertuples(index=False):
                 results.append({
                     "type": "review",
-                    "title": row['title'],
-                    "source": row['source'],
-                    "rating": row['rating'],
-                    "price": row['price'],
-                    "publication_date": row['publication_date'].isoformat() if pd.notna(row['publication_date']) else None,
+                    "title": row.title,
+                    "source": row.source,
+                    "rating": row.rating,
+                    "price": row.price,
+                    "publication_date": row.publication_date.isoformat() if pd.notna(row.publication_date) else None,
                     "match_type": "title"
                 })
             
-            for _, row in verdict_matches.head(limit//2).iterrows():
+            for row in _widen_float32(verdict_matches.head(limit//2)).itertuples(index=False):
                 results.append({
                     "type": "review",
-                    "title": row['title'],
-                    "source": row['source'],
-                    "rating": row['rating'],
-                    "price": row['price'],
-                    "publication_date": row['publication_date'].isoformat() if pd.notna(row['publication_date']) else None,
+                    "title": row.title,
+                    "source": row.source,
+                    "rating": row.rating,
+                    "price": row.price,
+                    "publication_date": row.publication_date.isoformat() if pd.notna(row.publication_date) else None,
                     "match_type": "verdict"
                 })
     
@@ -1,5 +1,6 @@
 import random
 from scrapy import signals
+from scrapy.exceptions import NotConfigured
 
 class RandomUserAgentMiddleware:
     """
@@ -7,21 +8,28 @@ class RandomUserAgentMiddleware:
     defined in the project settings.
     """
     def __init__(self, user_agents):
-        self.user_agents = user_agents
+        self.user_agents = list(user_agents)
+        # A private generator avoids the lock on the shared module-level one
+        self._rand = random.Random()
+        self._n = len(self.user_agents)
 
     @classmethod
     def from_crawler(cls, crawler):
         # This classmethod is used by Scrapy to create an instance of the middleware.
         # It correctly loads the USER_AGENTS list from settings.py.
-        return cls(user_agents=crawler.settings.get('USER_AGENTS', []))
+        user_agents = crawler.settings.get('USER_AGENTS', [])
+        if not user_agents:
+            # Nothing to rotate; Scrapy leaves the middleware out of the chain
+            raise NotConfigured("USER_AGENTS is empty")
+        # Encoded once here; Scrapy stores bytes header values as they are
+        return cls(user_agents=[ua.encode('latin-1') for ua in user_agents])
 
     def process_request(self, request, spider):
         # Called for each request that goes through the downloader middleware.
-        if self.user_agents:
-            user_agent = random.choice(self.user_agents)
-            request.headers['User-Agent'] = user_agent
-            # Uncomment the line below for debugging to see which user-agent is being used
-            # spider.logger.debug(f"Using User-Agent: {user_agent}")
+        user_agent = self.user_agents[self._rand.randrange(self._n)]
+        request.headers['User-Agent'] = user_agent
+        # Uncomment the line below for debugging to see which user-agent is being used
+        # spider.logger.debug(f"Using User-Agent: {user_agent}")
 
 # You can keep the other default middleware classes below if you wish,
 # but the RandomUserAgentMiddleware is the one that needed fixing.
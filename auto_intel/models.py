@@ -1,8 +1,67 @@
 import re
-from datetime import date, datetime
-from typing import Optional, Any
+from datetime import date
+from typing import List, Optional, Any
+
+import pandas as pd
+from pydantic import BaseModel, HttpUrl, TypeAdapter, ValidationError, field_validator
+
+# Compiled once; the validators run for every scraped item
+_NON_DIGIT_RE = re.compile(r'\D')
+_RATING_RE = re.compile(r'(\d+\.\d+|\d+)')
+# Scraped dates are mostly "15 Jan 2024"; matched directly instead of through strptime
+_DAY_MONTH_YEAR_RE = re.compile(r'(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})', re.ASCII)
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+# Built once for the frame path, which checks every link of a dataset
+_HTTP_URL = TypeAdapter(HttpUrl)
+
+
+def _column_dates(values: pd.Series) -> pd.Series:
+    """Column version of parse_publication_date: day-month-year first, then ISO"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        parsed = values
+    else:
+        text = values.astype('string').str.strip()
+        parsed = pd.to_datetime(text, format='%d %b %Y', errors='coerce')
+        parsed = parsed.fillna(pd.to_datetime(text, format='ISO8601', errors='coerce'))
+    return parsed.dt.date.where(parsed.notna(), None)
+
+
+def _column_prices(values: pd.Series) -> pd.Series:
+    """Column version of parse_price: the digits of each value as an integer"""
+    digits = values.astype('string').str.replace(_NON_DIGIT_RE, '', regex=True)
+    prices = pd.to_numeric(digits.mask(digits == ''), errors='coerce').astype('Int64')
+    return prices.astype(object).where(prices.notna(), None)
+
+
+def _column_ratings(values: pd.Series) -> pd.Series:
+    """Column version of parse_rating: numbers as floats, otherwise the first number in the text"""
+    if pd.api.types.is_numeric_dtype(values):
+        ratings = values.astype(float)
+    else:
+        ratings = values.astype('string').str.extract(_RATING_RE, expand=False).astype(float)
+    return ratings.astype(object).where(ratings.notna(), None)
+
+
+def _url_or_none(value: Any) -> Optional[HttpUrl]:
+    """The value as an HttpUrl, or None when it is not a valid URL"""
+    try:
+        return _HTTP_URL.validate_python(value)
+    except ValidationError:
+        return None
+
+
+def _construct_models(model, df: pd.DataFrame) -> list:
+    """Build model instances from already parsed columns without re-running the validators"""
+    links = df['link'].map(_url_or_none, na_action='ignore')
+    df = df.assign(link=links)[links.notna().to_numpy(dtype=bool)]
+    columns = [field for field in model.model_fields if field in df.columns]
+    records = df[columns].astype(object)
+    records = records.where(records.notna(), None)
+    return [model.model_construct(**row) for row in records.to_dict('records')]
 
-from pydantic import BaseModel, HttpUrl, field_validator
 
 class ArticleModel(BaseModel):
     title: str
@@ -21,15 +80,41 @@ class ArticleModel(BaseModel):
         if isinstance(value, date):
             return value
         if isinstance(value, str):
-            try:
-                return datetime.strptime(value.strip(), "%d %b %Y").date()
-            except (ValueError, TypeError):
+            match = _DAY_MONTH_YEAR_RE.fullmatch(value.strip())
+            if match:
+                day, month, year = match.groups()
+                month = _MONTHS.get(month.lower())
+                if month is None:
+                    return None
                 try:
-                    return date.fromisoformat(value)
-                except (ValueError, TypeError):
+                    return date(int(year), month, int(day))
+                except ValueError:
                     return None
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                return None
         return None
 
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> List["ArticleModel"]:
+        """
+        Build articles from a whole frame at once
+        
+        The dates are parsed column-wise and the instances are built with
+        model_construct instead of running the validators row by row. Rows
+        without a valid link are left out.
+        
+        Args:
+            df: Frame with the model's fields as columns
+            
+        Returns:
+            List of ArticleModel instances
+        """
+        if 'publication_date' in df.columns:
+            df = df.assign(publication_date=_column_dates(df['publication_date']))
+        return _construct_models(cls, df)
+
 
 class CarReviewModel(BaseModel):
     title: str
@@ -56,7 +141,7 @@ class CarReviewModel(BaseModel):
         if value is None:
             return None
         price_str = str(value)
-        digits = re.sub(r'\D', '', price_str)
+        digits = _NON_DIGIT_RE.sub('', price_str)
         if digits:
             return int(digits)
         return None
@@ -70,7 +155,36 @@ class CarReviewModel(BaseModel):
         if isinstance(value, (float, int)):
             return float(value)
         if isinstance(value, str):
-            match = re.search(r'(\d+\.\d+|\d+)', value)
+            match = _RATING_RE.search(value)
             if match:
                 return float(match.group(1))
-        return None
\ No newline at end of file
+        return None
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> List["CarReviewModel"]:
+        """
+        Build reviews from a whole frame at once
+        
+        Mirrors the field validators with vectorized column operations and
+        builds the instances with model_construct. Rows whose title or source
+        is empty after stripping, or whose link is invalid, are left out as
+        validation would reject them; unparseable dates become None.
+        
+        Args:
+            df: Frame with the model's fields as columns
+            
+        Returns:
+            List of CarReviewModel instances
+        """
+        title = df['title'].astype('string').str.strip()
+        source = df['source'].astype('string').str.strip()
+        parsed = {'title': title, 'source': source}
+        if 'publication_date' in df.columns:
+            parsed['publication_date'] = _column_dates(df['publication_date'])
+        if 'price' in df.columns:
+            parsed['price'] = _column_prices(df['price'])
+        if 'rating' in df.columns:
+            parsed['rating'] = _column_ratings(df['rating'])
+        
+        valid = ((title.str.len() > 0) & (source.str.len() > 0)).fillna(False).to_numpy(dtype=bool)
+        return _construct_models(cls, df.assign(**parsed)[valid])
@@ -1,67 +1,174 @@
-import psycopg2
+import os
+import threading
+from collections import deque
+from datetime import date, datetime
+
+import psycopg
+import pyarrow as pa
+import pyarrow.parquet as pq
 from decouple import config
-from itemadapter import ItemAdapter
-from pydantic import ValidationError
+from psycopg_pool import ConnectionPool
+from pydantic import TypeAdapter, ValidationError
 from scrapy.exceptions import DropItem
+from twisted.internet.defer import Deferred
 
 from .items import ArticleItem, CarReviewItem
 from .models import ArticleModel, CarReviewModel
 
 
+# Built once at import; both pipelines validate every scraped item through these
+_ARTICLE_VALIDATOR = TypeAdapter(ArticleModel)
+_REVIEW_VALIDATOR = TypeAdapter(CarReviewModel)
+
+
 class PostgresPipeline:
+    """Validate items, insert them in batches and commit once per several batches.
+
+    Connections come from a pool: one is checked out at the first flush of a transaction
+    and returned when that transaction commits or rolls back. Full batches go onto a
+    submission queue drained by one writer thread, so the crawl never waits on the database.
+    """
+
+    # Articles are the bulk of a crawl: they are COPYed into a per-session staging table,
+    # then moved across in one INSERT ... SELECT that skips links already stored
+    ARTICLE_STAGING = """
+        CREATE TEMP TABLE staging_article_news AS
+        SELECT title, link, author, publication_date, source, content
+        FROM article_news WITH NO DATA;
+    """
+
+    ARTICLE_COPY = """
+        COPY staging_article_news (title, link, author, publication_date, source, content) FROM STDIN
+    """
+
+    ARTICLE_MERGE = """
+        INSERT INTO article_news (title, link, author, publication_date, source, content)
+        SELECT title, link, author, publication_date, source, content FROM staging_article_news
+        ON CONFLICT (link) DO NOTHING;
+    """
+
+    ARTICLE_STAGING_RESET = "TRUNCATE staging_article_news;"
+
+    # Reviews are COPYed in binary, so the numeric rating and price need no text round trip;
+    # binary COPY needs exact column types, hence an explicitly typed staging table
+    REVIEW_STAGING = """
+        CREATE TEMP TABLE staging_car_reviews (
+            title text, link text, author text, publication_date date, source text,
+            verdict text, rating double precision, price bigint
+        );
+    """
+
+    REVIEW_COPY = """
+        COPY staging_car_reviews (title, link, author, publication_date, source, verdict, rating, price)
+        FROM STDIN (FORMAT BINARY)
+    """
+
+    REVIEW_COPY_TYPES = ['text', 'text', 'text', 'date', 'text', 'text', 'float8', 'int8']
+
+    REVIEW_MERGE = """
+        INSERT INTO car_reviews (title, link, author, publication_date, source, verdict, rating, price)
+        SELECT title, link, author, publication_date, source, verdict, rating, price FROM staging_car_reviews
+        ON CONFLICT (link) DO NOTHING;
+    """
+
+    REVIEW_STAGING_RESET = "TRUNCATE staging_car_reviews;"
+
+    STORED_LINKS = "SELECT link FROM article_news UNION ALL SELECT link FROM car_reviews;"
+
+    def __init__(self, batch_size=200, commit_batch=500, pool_min=2, pool_max=16):
+        self.batch_size = batch_size
+        self.commit_batch = commit_batch
+        self.pool_min = pool_min
+        self.pool_max = pool_max
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            batch_size=crawler.settings.getint('POSTGRES_BATCH_SIZE', 200),
+            commit_batch=crawler.settings.getint('POSTGRES_COMMIT_BATCH', 500),
+            pool_min=crawler.settings.getint('POSTGRES_POOL_MIN', 2),
+            pool_max=crawler.settings.getint('POSTGRES_POOL_MAX', 16),
+        )
+
     def open_spider(self, spider):
-        """Connect to the PostgreSQL database."""
+        """Open the PostgreSQL connection pool."""
+        self.buffers = {'articles': [], 'reviews': []}
+        self.buffered_links = {'articles': [], 'reviews': []}
+        self._since_commit = 0
+        self.connection = None
+        self.cursor = None
         try:
-            self.connection = psycopg2.connect(
-                host=config('POSTGRES_HOST'),
-                dbname=config('POSTGRES_DB'),
-                user=config('POSTGRES_USER'),
-                password=config('POSTGRES_PASSWORD')
+            self.pool = ConnectionPool(
+                min_size=self.pool_min,
+                max_size=self.pool_max,
+                kwargs=dict(
+                    host=config('POSTGRES_HOST'),
+                    dbname=config('POSTGRES_DB'),
+                    user=config('POSTGRES_USER'),
+                    password=config('POSTGRES_PASSWORD')
+                ),
+                configure=self._configure_session,
+                open=True
             )
-            self.cursor = self.connection.cursor()
-            spider.logger.info("✅ Database connection established.")
-        except (psycopg2.OperationalError, Exception) as e:
+            self.pool.wait()
+            # Every stored link, held exactly rather than in a bloom filter so that a false
+            # positive can never drop a new item; re-crawled pages then skip the database
+            with self.pool.connection() as connection:
+                self._stored_links = {link for (link,) in connection.execute(self.STORED_LINKS)}
+            # Links buffered or inserted but not yet committed: skipped as repeats while pending,
+            # moved into _stored_links by a commit and forgotten by a rollback
+            self._pending_links = set()
+            self._uncommitted_links = []
+            self._links_lock = threading.Lock()
+            spider.logger.info(
+                f"✅ Database connection pool established; {len(self._stored_links)} links already stored."
+            )
+        except (psycopg.OperationalError, Exception) as e:
             spider.logger.critical(f"❌ DATABASE CONNECTION FAILED: {e}")
             raise e
 
+        # Submission queue of (kind, rows) batches; the writer thread alone touches the database
+        self._submissions = deque()
+        self._wakeup = threading.Event()
+        self._closing = False
+        self._finished = Deferred()
+        self._writer = threading.Thread(
+            target=self._drain, args=(spider,), name='postgres-writer', daemon=True
+        )
+        self._writer.start()
+
     def close_spider(self, spider):
-        """Close the database connection."""
-        self.cursor.close()
-        self.connection.close()
-        spider.logger.info("✅ Database connection closed.")
+        """Submit any buffered rows and wait for the writer to commit them and close the pool."""
+        for kind in self.buffers:
+            self._flush(kind, spider)
+        self._closing = True
+        self._wakeup.set()
+        return self._finished
 
     def process_item(self, item, spider):
-        adapter = ItemAdapter(item)
-        
+        with self._links_lock:
+            if item.get('link') in self._stored_links or item.get('link') in self._pending_links:
+                return item
+
         try:
             if isinstance(item, ArticleItem):
                 # 1. Validate the item using the Pydantic model
-                validated_data = ArticleModel(**adapter.asdict())
-                
-                # 2. Insert the validated data
-                self.cursor.execute("""
-                    INSERT INTO article_news (title, link, author, publication_date, source, content)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (link) DO NOTHING;
-                """, (
+                kind = 'articles'
+                validated_data = _ARTICLE_VALIDATOR.validate_python(dict(item))
+                row = (
                     validated_data.title,
                     str(validated_data.link),
                     validated_data.author,
                     validated_data.publication_date,
                     validated_data.source,
-                    validated_data.content, # <-- ADD THIS VALUE
-                ))
+                    validated_data.content,
+                )
             
             elif isinstance(item, CarReviewItem):
                 # 1. Validate the item using the Pydantic model
-                validated_data = CarReviewModel(**adapter.asdict())
-                
-                # 2. Insert the validated data
-                self.cursor.execute("""
-                    INSERT INTO car_reviews (title, link, author, publication_date, source, verdict, rating, price)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (link) DO NOTHING;
-                """, (
+                kind = 'reviews'
+                validated_data = _REVIEW_VALIDATOR.validate_python(dict(item))
+                row = (
                     validated_data.title,
                     str(validated_data.link),
                     validated_data.author,
@@ -70,21 +177,228 @@ class PostgresPipeline:
                     validated_data.verdict,
                     validated_data.rating,
                     validated_data.price
-                ))
+                )
 
-            # Commit the transaction to the database
-            self.connection.commit()
-            spider.logger.info(f"✅ Item stored: {adapter.get('title')}")
-            return item
+            else:
+                return item
 
         except ValidationError as e:
             # Pydantic validation failed
-            self.connection.rollback()
-            spider.logger.error(f"❌ Pydantic Validation Failed for {adapter.get('link')}: {e}")
-            raise DropItem(f"Validation failed for item: {adapter.get('title')}")
-
-        except psycopg2.Error as e:
-            # Database insertion failed
-            self.connection.rollback()
-            spider.logger.error(f"❌ DB Insert Failed for {adapter.get('link')}: {e}")
-            raise DropItem(f"Database error for item: {adapter.get('title')}")
\ No newline at end of file
+            spider.logger.error(f"❌ Pydantic Validation Failed for {item.get('link')}: {e}")
+            raise DropItem(f"Validation failed for item: {item.get('title')}")
+
+        # 2. Buffer the validated row; it is inserted with the rest of its batch
+        links = (item.get('link'), row[1])
+        with self._links_lock:
+            self._pending_links.update(links)
+        self.buffers[kind].append(row)
+        self.buffered_links[kind].extend(links)
+        if len(self.buffers[kind]) >= self.batch_size:
+            self._flush(kind, spider)
+        return item
+
+    def _flush(self, kind, spider):
+        """Put the buffered rows of one kind on the submission queue and return without waiting."""
+        rows = self.buffers[kind]
+        if not rows:
+            return
+        links = self.buffered_links[kind]
+        self.buffers[kind] = []
+        self.buffered_links[kind] = []
+
+        self._submissions.append((kind, rows, links))
+        self._wakeup.set()
+
+    def _drain(self, spider):
+        """Writer thread: insert submitted batches until the spider closes, then finish up."""
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            # Read before draining: batches submitted before close are then all seen below
+            closing = self._closing
+            while self._submissions:
+                kind, rows, links = self._submissions.popleft()
+                try:
+                    self._insert(kind, rows, links, spider)
+                except Exception as e:
+                    spider.logger.error(f"❌ DB Write Failed for {len(rows)} {kind}: {e}")
+            if closing:
+                break
+
+        try:
+            self._commit(spider)
+            # Closing the sessions also drops their staging tables
+            self.pool.close()
+            spider.logger.info("✅ Database connection pool closed.")
+        finally:
+            # Completion is posted back to the reactor, where close_spider is waiting on it;
+            # imported here so loading the pipeline never installs a reactor of its own
+            from twisted.internet import reactor
+            reactor.callFromThread(self._finished.callback, None)
+
+    def _insert(self, kind, rows, links, spider):
+        """Run the insert for one batch on the current transaction's connection."""
+        # Counted in the transaction up front, so a failure below forgets this batch's links too
+        self._uncommitted_links.extend(links)
+        try:
+            self._checkout()
+            if kind == 'articles':
+                with self.cursor.copy(self.ARTICLE_COPY) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+                self.cursor.execute(self.ARTICLE_MERGE)
+                self.cursor.execute(self.ARTICLE_STAGING_RESET)
+            else:
+                with self.cursor.copy(self.REVIEW_COPY) as copy:
+                    copy.set_types(self.REVIEW_COPY_TYPES)
+                    for row in rows:
+                        copy.write_row(row)
+                self.cursor.execute(self.REVIEW_MERGE)
+                self.cursor.execute(self.REVIEW_STAGING_RESET)
+        except Exception as e:
+            # Insertion failed, in the database or while encoding a row for COPY;
+            # everything since the last commit is rolled back and the connection returned
+            self._release(rollback=True)
+            spider.logger.error(
+                f"❌ DB Insert Failed for {len(rows)} {kind}, "
+                f"{self._since_commit} earlier uncommitted rows discarded: {e}"
+            )
+            self._since_commit = 0
+            return
+
+        self._since_commit += len(rows)
+        if self._since_commit >= self.commit_batch:
+            self._commit(spider)
+
+    def _commit(self, spider):
+        """Commit the rows inserted since the last commit."""
+        if not self._since_commit:
+            return
+        try:
+            self.connection.commit()
+            self._release()
+            spider.logger.info(f"✅ Stored {self._since_commit} items")
+        except Exception as e:
+            self._release(rollback=True)
+            spider.logger.error(f"❌ DB Commit Failed for {self._since_commit} items: {e}")
+        self._since_commit = 0
+
+    def _configure_session(self, connection):
+        """Create the session's staging tables when the pool opens a new connection."""
+        # Committed straight away so a later rollback cannot drop the staging tables
+        connection.execute(self.ARTICLE_STAGING)
+        connection.execute(self.REVIEW_STAGING)
+        connection.commit()
+
+    def _checkout(self):
+        """Take a connection from the pool for the current transaction unless one is held."""
+        if self.connection is not None:
+            return
+        self.connection = self.pool.getconn()
+        self.cursor = self.connection.cursor()
+
+    def _release(self, rollback=False):
+        """Settle the transaction's links and return its connection to the pool, which drops it if broken."""
+        # Only committed links are known to be stored; rolled back ones may be offered again
+        links, self._uncommitted_links = self._uncommitted_links, []
+        with self._links_lock:
+            self._pending_links.difference_update(links)
+            if not rollback:
+                self._stored_links.update(links)
+
+        connection = self.connection
+        if connection is None:
+            return
+        self.connection = None
+        self.cursor = None
+        if rollback and not connection.closed:
+            connection.rollback()
+        self.pool.putconn(connection)
+
+
+class ParquetPipeline:
+    """Stream validated items into date-partitioned Parquet files for the analysis stage."""
+
+    ARTICLE_SCHEMA = pa.schema([
+        ('title', pa.string()),
+        ('link', pa.string()),
+        ('author', pa.string()),
+        ('publication_date', pa.date32()),
+        ('source', pa.string()),
+        ('content', pa.string()),
+    ])
+
+    REVIEW_SCHEMA = pa.schema([
+        ('title', pa.string()),
+        ('link', pa.string()),
+        ('author', pa.string()),
+        ('publication_date', pa.date32()),
+        ('source', pa.string()),
+        ('verdict', pa.string()),
+        ('rating', pa.float64()),
+        ('price', pa.int64()),
+    ])
+
+    def __init__(self, output_dir, batch_size=500):
+        self.output_dir = output_dir
+        self.batch_size = batch_size
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            output_dir=crawler.settings.get('PARQUET_OUTPUT_DIR'),
+            batch_size=crawler.settings.getint('PARQUET_BATCH_SIZE', 500),
+        )
+
+    def open_spider(self, spider):
+        """Reset the buffers; a writer is opened when the first item of its kind is flushed."""
+        self.writers = {}
+        self.buffers = {'articles': [], 'reviews': []}
+        # One file per crawl inside today's partition so repeated runs never overwrite
+        self.partition = f"date={date.today().isoformat()}"
+        self.file_name = f"part-{spider.name}-{datetime.now():%H%M%S}.parquet"
+
+    def close_spider(self, spider):
+        """Flush any buffered rows and close the Parquet writers."""
+        for kind in self.buffers:
+            self._flush(kind)
+        for writer in self.writers.values():
+            writer.close()
+        spider.logger.info(f"✅ Parquet output written to {self.output_dir}")
+
+    def process_item(self, item, spider):
+        try:
+            if isinstance(item, ArticleItem):
+                kind = 'articles'
+                validated_data = _ARTICLE_VALIDATOR.validate_python(dict(item))
+            elif isinstance(item, CarReviewItem):
+                kind = 'reviews'
+                validated_data = _REVIEW_VALIDATOR.validate_python(dict(item))
+            else:
+                return item
+        except ValidationError as e:
+            spider.logger.error(f"❌ Pydantic Validation Failed for {item.get('link')}: {e}")
+            raise DropItem(f"Validation failed for item: {item.get('title')}")
+
+        row = validated_data.model_dump()
+        row['link'] = str(validated_data.link)
+        self.buffers[kind].append(row)
+
+        if len(self.buffers[kind]) >= self.batch_size:
+            self._flush(kind)
+        return item
+
+    def _flush(self, kind):
+        """Append the buffered rows of one kind to its Parquet file as a row group."""
+        rows = self.buffers[kind]
+        if not rows:
+            return
+
+        schema = self.ARTICLE_SCHEMA if kind == 'articles' else self.REVIEW_SCHEMA
+        if kind not in self.writers:
+            directory = os.path.join(self.output_dir, kind, self.partition)
+            os.makedirs(directory, exist_ok=True)
+            self.writers[kind] = pq.ParquetWriter(os.path.join(directory, self.file_name), schema)
+
+        self.writers[kind].write_table(pa.Table.from_pylist(rows, schema=schema))
+        self.buffers[kind] = []
@@ -15,13 +15,28 @@ NEWSPIDER_MODULE = 'auto_intel.spiders'
 # Obey robots.txt rules
 ROBOTSTXT_OBEY = True
 
+# Configure maximum concurrent requests performed by Scrapy (default: 16);
+# a ceiling only: the per-domain limit below is the one that binds, since the news
+# spider crawls three hosts and the reviews spider two, at most 12 requests in flight
+CONCURRENT_REQUESTS = 32
+
 # Configure a delay for requests for the same website (default: 0)
 # See https://docs.scrapy.org/en/latest/topics/settings.html#download-delay
 # See also autothrottle settings and docs
 DOWNLOAD_DELAY = 1
-# The download delay setting will honor only one of:
-CONCURRENT_REQUESTS_PER_DOMAIN = 16
-CONCURRENT_REQUESTS_PER_IP = 16
+# The download delay setting will honor only one of the two limits below; each host
+# is held to 4 requests so one slow site cannot take the whole global budget
+CONCURRENT_REQUESTS_PER_DOMAIN = 4
+# CONCURRENT_REQUESTS_PER_IP stays at 0: the downloader-aware queue below requires it
+
+# Hand out requests by downloader slot so one busy site cannot hold up the others;
+# the spiders give article page requests a higher priority than listing pages, so
+# items reach the pipelines steadily instead of all at the end of the crawl
+SCHEDULER_PRIORITY_QUEUE = 'scrapy.pqueues.DownloaderAwarePriorityQueue'
+
+# Give up on stalled pages after 30s instead of the 180s default, and retry them twice
+DOWNLOAD_TIMEOUT = 30
+RETRY_TIMES = 2
 
 # Disable cookies (enabled by default)
 COOKIES_ENABLED = False
@@ -56,9 +71,21 @@ DOWNLOADER_MIDDLEWARES = {
 
 # Configure item pipelines
 # See https://docs.scrapy.org/en/latest/topics/item-pipeline.html
-#ITEM_PIPELINES = {
-#    'auto_intel.pipelines.AutoIntelPipeline': 300,
-#}
+ITEM_PIPELINES = {
+   'auto_intel.pipelines.ParquetPipeline': 300,
+}
+
+# Validated items are streamed to <dir>/{articles,reviews}/date=YYYY-MM-DD/*.parquet
+PARQUET_OUTPUT_DIR = '/opt/airflow/data'
+PARQUET_BATCH_SIZE = 500
+
+# Rows per multi-row INSERT, and per transaction, when auto_intel.pipelines.PostgresPipeline is enabled
+POSTGRES_BATCH_SIZE = 200
+POSTGRES_COMMIT_BATCH = 500
+# Connection pool bounds. Behind PgBouncer use pool_mode = session: the pipeline keeps
+# temporary staging tables on each server session
+POSTGRES_POOL_MIN = 2
+POSTGRES_POOL_MAX = 16
 
 # Enable and configure the AutoThrottle extension (disabled by default)
 # See https://docs.scrapy.org/en/latest/topics/autothrottle.html
@@ -68,8 +95,8 @@ AUTOTHROTTLE_START_DELAY = 1
 # The maximum download delay to be set in case of high latencies
 AUTOTHROTTLE_MAX_DELAY = 60
 # The average number of requests Scrapy should be sending in parallel to
-# each remote server
-AUTOTHROTTLE_TARGET_CONCURRENCY = 1.0
+# each remote server; kept within CONCURRENT_REQUESTS_PER_DOMAIN, which caps it anyway
+AUTOTHROTTLE_TARGET_CONCURRENCY = 4.0
 # Enable showing throttling stats for every response received:
 #AUTOTHROTTLE_DEBUG = False
 
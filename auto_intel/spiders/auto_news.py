@@ -1,21 +1,133 @@
 import scrapy
 import dateparser
-from datetime import datetime
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urlencode, urljoin, urlsplit
 from auto_intel.items import ArticleItem
+from auto_intel.spiders._common import (
+    ARTICLE_PRIORITY, AUTHOR_NAMES_XPATH, DATE_CACHE_SIZE, DATE_XPATH,
+    _compile_css, _first_text, _parse_day_month_year, _site,
+)
+
+# Auto Express listing lookups, evaluated on lxml nodes directly
+AX_ARTICLE_LINKS_CSS = "a.polaris__link.polaris__article-card--link"
+AX_ARTICLE_LINKS_XPATH = _compile_css(AX_ARTICLE_LINKS_CSS)
+NODE_TEXT_XPATH = _compile_css("::text")
+
+# Listing parser method for each site, keyed by host without the leading "www."
+LISTING_PARSERS = {
+    "carmagazine.co.uk": "parse_carmagazine",
+    "pistonheads.com": "parse_pistonheads",
+    "autoexpress.co.uk": "parse_autoexpress",
+}
+
+
+def _listing_url(base, page):
+    """URL of a numbered listing page; page 1 is the bare listing URL"""
+    return base if page == 1 else f"{base}?{urlencode({'page': page})}"
+
+
+def _link_joiner(base):
+    """Function resolving links against a listing page URL, splitting the base only once per page"""
+    parts = urlsplit(base)
+    root = f"{parts.scheme}://{parts.netloc}"
+
+    def join(link):
+        # Listing pages only link absolute or root-relative; anything else goes through urljoin
+        if not link:
+            return base
+        if link.startswith(("https://", "http://")):
+            return link
+        if link.startswith("/") and not link.startswith("//") and "/." not in link:
+            return root + link
+        return urljoin(base, link)
+
+    return join
+
+
+# Built once; all sources are English, so language detection is skipped on every call
+_DATE_DATA_PARSER = dateparser.DateDataParser(languages=['en'], settings={'PREFER_DATES_FROM': 'past'})
+
+
+# Almost every scraped date is ISO or "15 January 2024"; those skip dateparser entirely
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})', re.ASCII)
+_DAY_MONTH_YEAR_RE = re.compile(r'(\d{1,2})\s+([A-Za-z]{3,9})\s+(\d{4})', re.ASCII)
+_MONTHS = {
+    name: number
+    for number, names in enumerate([
+        ('jan', 'january'), ('feb', 'february'), ('mar', 'march'), ('apr', 'april'),
+        ('may',), ('jun', 'june'), ('jul', 'july'), ('aug', 'august'),
+        ('sep', 'sept', 'september'), ('oct', 'october'), ('nov', 'november'), ('dec', 'december'),
+    ], start=1)
+    for name in names
+}
+
+
+def _fast_parse_date(text: str) -> Optional[date]:
+    """Date of a string starting with an ISO or day-month-year date, or None for any other shape"""
+    match = _ISO_DATE_RE.match(text)
+    if match:
+        year, month, day = map(int, match.groups())
+    else:
+        match = _DAY_MONTH_YEAR_RE.match(text)
+        if not match:
+            return None
+        month = _MONTHS.get(match.group(2).lower())
+        if month is None:
+            return None
+        day, year = int(match.group(1)), int(match.group(3))
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+# PistonHeads prints the date as a paragraph of its own, e.g. <p>3 April 2024</p>
+_PISTONHEADS_DATE_RE = re.compile(rb'<p\b[^>]*>\s*(\d{1,2})\s+([A-Za-z]{3,9})\s+(20\d{2})\s*</p>')
+
+
+def _pistonheads_date(body: bytes) -> Optional[date]:
+    """Date from the first paragraph of a PistonHeads page that holds only a date, or None"""
+    match = _PISTONHEADS_DATE_RE.search(body)
+    if not match:
+        return None
+    month = _MONTHS.get(match.group(2).decode('ascii').lower())
+    if month is None:
+        return None
+    try:
+        return date(int(match.group(3)), month, int(match.group(1)))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_natural_date(text: str) -> Optional[date]:
+    """Date of a free-form date string, trying the fixed formats before the shared DateDataParser"""
+    parsed = _fast_parse_date(text)
+    if parsed:
+        return parsed
+    
+    date_data = _DATE_DATA_PARSER.get_date_data(text)
+    return date_data.date_obj.date() if date_data and date_data.date_obj else None
 
 class AutoNewsSpider(scrapy.Spider):
     name = "auto_news"
     allowed_domains = ["carmagazine.co.uk", "pistonheads.com", "autoexpress.co.uk"]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Auto Express articles already followed; car-news and consumer-issues share many
+        self._seen_links = set()
+
     # start_requests method remains the same...
     def start_requests(self):
         # Car Magazine - 20 pages
-        for page in range(1, 21):
-            url = "https://www.carmagazine.co.uk/car-news/" if page == 1 else f"https://www.carmagazine.co.uk/car-news/?page={page}"
-            yield scrapy.Request(url=url, callback=self.parse)
+        urls = [_listing_url("https://www.carmagazine.co.uk/car-news/", page) for page in range(1, 21)]
 
         # PistonHeads - 15 pages (they are JS heavy, so only root + pages if applicable)
-        yield scrapy.Request(url="https://www.pistonheads.com/news", callback=self.parse)
+        urls.append("https://www.pistonheads.com/news")
 
         # AutoExpress - 20 pages each for car-news and consumer-issues
         autoexpress_paths = [
@@ -23,76 +135,80 @@ class AutoNewsSpider(scrapy.Spider):
             "https://www.autoexpress.co.uk/consumer-issues"
         ]
         for base in autoexpress_paths:
-            for page in range(1, 5):
-                url = base if page == 1 else f"{base}?page={page}"
-                yield scrapy.Request(url=url, callback=self.parse)
+            urls.extend(_listing_url(base, page) for page in range(1, 5))
+
+        # Build each Request once, even if two listings canonicalise to the same URL
+        for url in dict.fromkeys(urls):
+            yield scrapy.Request(url=url, callback=self.parse)
 
     def parse(self, response):
-        domain = response.url.split('/')[2]
-        if "carmagazine.co.uk" in domain:
-            yield from self.parse_carmagazine(response)
-        elif "pistonheads.com" in domain:
-            yield from self.parse_pistonheads(response)
-        elif "autoexpress.co.uk" in domain:
-            yield from self.parse_autoexpress(response)
+        parser = LISTING_PARSERS.get(_site(response.url))
+        if parser:
+            yield from getattr(self, parser)(response)
 
     def parse_carmagazine(self, response):
         articles = response.css("article.panel")
+        join = _link_joiner(response.url)
         for article in articles:
-            link = response.urljoin(article.css("h3.title a::attr(href)").get())
+            link = join(article.css("h3.title a::attr(href)").get())
             raw_date = article.css("span.date::text").get(default="").strip()
-            parsed_date = dateparser.parse(raw_date)
 
             item = ArticleItem(
                 title=article.css("h3.title a::text").get(),
                 link=link,
                 author=article.css("span.author::text").get(default="").strip(),
-                publication_date=parsed_date.date() if parsed_date else None, # FIXED
+                publication_date=_parse_natural_date(raw_date), # FIXED
                 source="Car Magazine UK"
             )
             yield item
 
     def parse_pistonheads(self, response):
         articles = response.css("a[data-gtm-event-action='click-article']")
+        join = _link_joiner(response.url)
         for article in articles:
             url = article.attrib.get("href")
             if url:
-                full_url = response.urljoin(url)
-                yield scrapy.Request(url=full_url, callback=self.parse_pistonheads_article)
+                full_url = join(url)
+                yield scrapy.Request(url=full_url, callback=self.parse_pistonheads_article, priority=ARTICLE_PRIORITY)
 
     def parse_pistonheads_article(self, response):
-        date_text = response.xpath("//p/text()[contains(., '202')]").get()
-        parsed_date = dateparser.parse(date_text.strip()) if date_text else None
+        # Scan the raw bytes for the usual date paragraph; search the text nodes only if it is missing
+        parsed_date = _pistonheads_date(response.body)
+        if parsed_date is None:
+            date_text = response.xpath("//p/text()[contains(., '202')]").get()
+            parsed_date = _parse_natural_date(date_text.strip()) if date_text else None
         
         yield ArticleItem(
             title=response.css("h1::text").get(default="").strip(),
             link=response.url,
             source="PistonHeads",
             author=response.css("a[data-gtm-event-action='author name click']::text").get(default="PistonHeads Staff").strip(),
-            publication_date=parsed_date.date() if parsed_date else None # FIXED
+            publication_date=parsed_date # FIXED
         )
 
     def parse_autoexpress(self, response):
-        articles = response.css("a.polaris__link.polaris__article-card--link")
+        articles = AX_ARTICLE_LINKS_XPATH(response.selector.root)
+        join = _link_joiner(response.url)
         for article in articles:
-            title = article.css("::text").get()
-            link = article.attrib.get("href")
-            full_url = response.urljoin(link) if link else None
+            title = _first_text(NODE_TEXT_XPATH(article))
+            link = article.get("href")
+            full_url = join(link) if link else None
+            if full_url in self._seen_links:
+                continue
+            self._seen_links.add(full_url)
             
             # The full date and author are often on the article page itself
-            yield response.follow(full_url, callback=self.parse_autoexpress_article, meta={'title': title})
+            yield response.follow(
+                full_url, callback=self.parse_autoexpress_article, meta={'title': title}, priority=ARTICLE_PRIORITY
+            )
 
     def parse_autoexpress_article(self, response):
         # Get the full date from the article page for better accuracy
-        date_text = response.css("span.polaris__date::text").get()
-        pub_date = None
-        if date_text:
-            try:
-                pub_date = datetime.strptime(date_text.strip().title(), "%d %b %Y").date() # FIXED
-            except ValueError:
-                pass
+        root = response.selector.root
+        date_text = _first_text(DATE_XPATH(root))
+        pub_date = _parse_day_month_year(date_text.strip().title()) if date_text else None # FIXED
         
-        authors = response.css("span.polaris__post-meta--author-name a::text").getall()
+        authors = [str(author) for author in AUTHOR_NAMES_XPATH(root)]
 
         yield ArticleItem(
             title=response.meta.get('title', '').strip(),
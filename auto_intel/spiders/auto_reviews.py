@@ -1,9 +1,50 @@
 import scrapy
 import re
+import string
 from auto_intel.items import CarReviewItem
-from datetime import datetime
+from auto_intel.spiders._common import (
+    ARTICLE_PRIORITY, AUTHOR_NAMES_XPATH, DATE_XPATH,
+    _compile_css, _first_text, _parse_day_month_year, _site,
+)
+from lxml import etree
 from w3lib.html import remove_tags
 
+# Verdict lookups are compiled once and evaluated against the parsed tree of each page;
+# the case folding alphabets are bound as XPath variables at call time
+AUTOEXPRESS_VERDICT_XPATH = etree.XPath(
+    "//div[contains(@class, 'polaris__simple-grid--main')]//p[preceding-sibling::h2[contains(translate(., $upper, $lower), 'verdict') or contains(translate(., $upper, $lower), 'our opinion')]][1]"
+)
+CARBUYER_VERDICT_XPATH = etree.XPath(
+    "//p[strong[contains(text(), 'verdict') or contains(text(), 'Verdict')]]/strong/following-sibling::text()[1]"
+)
+
+# Selectors shared by both review sites; links and prices go through response.css,
+# where parsel memoizes the translation, and the others are compiled to XPath below
+REVIEW_LINKS_CSS = "div.polaris__article-card > a.polaris__link::attr(href)"
+PRICE_CSS = "span.polaris__price--price::text"
+SPEC_TABLE_ROWS_CSS = "table.tablesaw tbody tr"
+
+# Value patterns for prices ("£25,000") and spec table ratings ("4.5 out of 5")
+_PRICE_RE = re.compile(r'£([\d,]+)')
+_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+# Review parser method for each site, keyed by host without the leading "www."
+REVIEW_PARSERS = {
+    "autoexpress.co.uk": "parse_autoexpress_review",
+    "carbuyer.co.uk": "parse_carbuyer_review",
+}
+
+
+# Spec table lookups, evaluated on lxml nodes directly
+SPEC_TABLE_ROWS_XPATH = _compile_css(SPEC_TABLE_ROWS_CSS)
+SPEC_HEADER_XPATH = _compile_css("td:nth-child(1)::text")
+SPEC_VALUE_XPATH = _compile_css("td:nth-child(2)::text")
+
+
+def _outer_html(element):
+    """Serialise a matched element the way Selector.get() does"""
+    return etree.tostring(element, method='html', encoding='unicode', with_tail=False)
+
 
 class AutoReviewsSpider(scrapy.Spider):
     name = "auto_reviews"
@@ -14,39 +55,46 @@ class AutoReviewsSpider(scrapy.Spider):
         f"https://www.carbuyer.co.uk/reviews?page={i}" for i in range(1, 31)
     ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Review URLs already followed; neighbouring listing pages overlap heavily
+        self._seen_links = set()
+
     def parse(self, response):
-        article_links = response.css("div.polaris__article-card > a.polaris__link::attr(href)").getall()
+        article_links = response.css(REVIEW_LINKS_CSS).getall()
         for link in article_links:
             if link and (link.startswith("http") or link.startswith("/")):
                 full_url = response.urljoin(link)
-                yield response.follow(full_url, callback=self.parse_article)
+                if full_url in self._seen_links:
+                    continue
+                self._seen_links.add(full_url)
+                yield response.follow(full_url, callback=self.parse_article, priority=ARTICLE_PRIORITY)
             else:
                 self.logger.info(f"Skipping invalid link: {link}")
 
     def parse_article(self, response):
-        domain = response.url.split('/')[2]
+        parser = REVIEW_PARSERS.get(_site(response.url))
         item = CarReviewItem()
         item['link'] = response.url
 
-        if "autoexpress.co.uk" in domain:
-            self.parse_autoexpress_review(response, item)
-        elif "carbuyer.co.uk" in domain:
-            self.parse_carbuyer_review(response, item)
+        if parser:
+            getattr(self, parser)(response, item)
 
         yield item
 
     def parse_autoexpress_review(self, response, item):
         item['title'] = response.css("h1.polaris__heading.-content-title::text, h1.polaris__heading--content-title::text").get()
         item['source'] = "Auto Express"
-        item['publication_date'] = self.parse_date(response.css("span.polaris__date::text").get())
+        root = response.selector.root
+        item['publication_date'] = self.parse_date(_first_text(DATE_XPATH(root)))
         
-        authors = response.css("span.polaris__post-meta--author-name a::text").getall()
+        authors = [str(author) for author in AUTHOR_NAMES_XPATH(root)]
         item['author'] = ", ".join(a.strip() for a in authors) if authors else None
 
-        verdict_node = response.xpath(
-            "//div[contains(@class, 'polaris__simple-grid--main')]//p[preceding-sibling::h2[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'verdict') or contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'our opinion')]][1]"
-        ).get()
-        item['verdict'] = remove_tags(verdict_node).strip() if verdict_node else None
+        verdict_nodes = AUTOEXPRESS_VERDICT_XPATH(
+            root, upper=string.ascii_uppercase, lower=string.ascii_lowercase
+        )
+        item['verdict'] = remove_tags(_outer_html(verdict_nodes[0])).strip() if verdict_nodes else None
 
         rating_text = response.css("p.polaris__rating--text::text").get()
         rating = None
@@ -65,13 +113,14 @@ class AutoReviewsSpider(scrapy.Spider):
     def parse_carbuyer_review(self, response, item):
         item['title'] = response.css("h1.polaris__heading.-content-title::text").get()
         item['source'] = "Carbuyer"
-        item['publication_date'] = self.parse_date(response.css("span.polaris__date::text").get())
+        root = response.selector.root
+        item['publication_date'] = self.parse_date(_first_text(DATE_XPATH(root)))
         
-        authors = response.css("span.polaris__post-meta--author-name a::text").getall()
+        authors = [str(author) for author in AUTHOR_NAMES_XPATH(root)]
         item['author'] = ", ".join(a.strip() for a in authors) if authors else None
 
-        verdict_node = response.xpath("//p[strong[contains(text(), 'verdict') or contains(text(), 'Verdict')]]/strong/following-sibling::text()[1]").get()
-        item['verdict'] = verdict_node.strip() if verdict_node else None
+        verdict_nodes = CARBUYER_VERDICT_XPATH(root)
+        item['verdict'] = str(verdict_nodes[0]).strip() if verdict_nodes else None
 
         rating_text = response.css("p.polaris__rating--text span::text").get()
         rating = None
@@ -85,16 +134,13 @@ class AutoReviewsSpider(scrapy.Spider):
 
     def parse_date(self, text):
         if text:
-            try:
-                return datetime.strptime(text.strip().title(), "%d %b %Y").date()
-            except ValueError:
-                return None
+            return _parse_day_month_year(text.strip().title())
         return None
 
     def extract_price(self, response):
-        prices = response.css("span.polaris__price--price::text").getall()
+        prices = response.css(PRICE_CSS).getall()
         for price_text in prices:
-            match = re.search(r'£([\d,]+)', price_text)
+            match = _PRICE_RE.search(price_text)
             if match:
                 return int(match.group(1).replace(',', ''))
         return None
@@ -102,20 +148,24 @@ class AutoReviewsSpider(scrapy.Spider):
     # FIXED: The arguments 'response' and 'item' are now in the correct order.
     def extract_from_table(self, response, item):
         """Fallback to extract data from a spec table if primary methods fail."""
-        rows = response.css("table.tablesaw tbody tr")
+        rows = SPEC_TABLE_ROWS_XPATH(response.selector.root)
         for row in rows:
-            header = (row.css("td:nth-child(1)::text").get() or "").strip().lower()
-            value = (row.css("td:nth-child(2)::text").get() or "").strip()
+            header = (_first_text(SPEC_HEADER_XPATH(row)) or "").strip().lower()
+            value = (_first_text(SPEC_VALUE_XPATH(row)) or "").strip()
 
             if not header or not value:
                 continue
             
             if "rating" in header and not item.get('rating'):
-                match = re.search(r"(\d+(\.\d+)?)", value)
+                match = _NUMBER_RE.search(value)
                 if match:
                     item['rating'] = float(match.group(1))
 
             if "price new" in header and not item.get('price'):
-                match = re.search(r'£([\d,]+)', value)
+                match = _PRICE_RE.search(value)
                 if match:
-                    item['price'] = int(match.group(1).replace(',', ''))
\ No newline at end of file
+                    item['price'] = int(match.group(1).replace(',', ''))
+
+            # Nothing left to fill; skip the rest of the table
+            if item.get('rating') and item.get('price'):
+                return
@@ -9,7 +9,8 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import json
+import plotly.io as pio
+import io
 import os
 from datetime import datetime
 import sys
@@ -20,6 +21,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from analysis.main_analyzer import AutoIntelAnalyzer
 from analysis.data_loader import DataLoader
 
+# Serialise chart specs with orjson; much faster than stdlib json on large histograms
+pio.json.config.default_engine = 'orjson'
+
+# Rows per page in the raw data explorer
+RAW_DATA_PAGE_ROWS = 1000
+
 # Page configuration
 st.set_page_config(
     page_title="Auto Intel Dashboard",
@@ -53,6 +60,10 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+def _with_month(df):
+    """Add the publication month shared by the time-based pages, as the correlation analysis derives it"""
+    return df.assign(month=df['publication_date'].dt.to_period('M'))
+
 @st.cache_data
 def load_data():
     """Load and cache the data"""
@@ -64,11 +75,38 @@ def load_data():
         article_df, reviews_df = loader.load_data()
         processed_article_df = loader.preprocess_article_news()
         processed_reviews_df = loader.preprocess_car_reviews()
-        return processed_article_df, processed_reviews_df
+        return _with_month(processed_article_df), _with_month(processed_reviews_df)
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None, None
 
+@st.cache_data
+def monthly_aggregates(article_df, reviews_df):
+    """Compute and cache the monthly chart data shared by the analysis and trends pages"""
+    reviews_by_month = reviews_df.groupby('month')
+    aggregates = {
+        'articles': article_df.groupby('month').size().reset_index(name='count'),
+        'reviews': reviews_by_month.size().reset_index(name='count'),
+        'ratings': reviews_by_month['rating'].agg(['mean', 'count']).reset_index(),
+        'prices': reviews_by_month['price'].agg(['mean', 'count']).reset_index()
+    }
+    for monthly in aggregates.values():
+        monthly['month'] = monthly['month'].astype(str)
+    return aggregates
+
+@st.cache_data
+def histogram_bins(values, bins=30):
+    """Compute and cache histogram counts and bin edges of a numeric column"""
+    counts, edges = np.histogram(values.dropna().to_numpy(dtype=np.float64), bins=bins)
+    return counts, edges
+
+def histogram_figure(values, title, x_label, bins=30):
+    """Build a histogram as a bar chart over cached bins"""
+    counts, edges = histogram_bins(values, bins)
+    fig = go.Figure(go.Bar(x=edges[:-1], y=counts, width=np.diff(edges), offset=0))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title='Count', bargap=0)
+    return fig
+
 @st.cache_data
 def run_analysis(article_df, reviews_df):
     """Run analysis and cache results"""
@@ -77,8 +115,8 @@ def run_analysis(article_df, reviews_df):
             article_news_path='project_data/article_news_202507212152.csv',
             car_reviews_path='project_data/car_reviews_202507231630.csv'
         )
-        analyzer.processed_article_df = article_df
-        analyzer.processed_reviews_df = reviews_df
+        analyzer.data_loader.processed_article_df = article_df
+        analyzer.data_loader.processed_reviews_df = reviews_df
         results = analyzer.run_comprehensive_analysis()
         insights = analyzer.generate_insights_report()
         return results, insights
@@ -189,13 +227,7 @@ def show_overview(article_df, reviews_df, results, insights):
     
     with col2:
         st.subheader("💰 Price Distribution")
-        fig = px.histogram(
-            reviews_df,
-            x='price',
-            nbins=30,
-            title="Car Price Distribution",
-            labels={'price': 'Price (£)', 'count': 'Count'}
-        )
+        fig = histogram_figure(reviews_df['price'], "Car Price Distribution", 'Price (£)')
         st.plotly_chart(fig, use_container_width=True)
     
     # Source analysis
@@ -230,14 +262,13 @@ def show_data_analysis(article_df, reviews_df):
     # Date range analysis
     st.write("### 📅 Publication Date Analysis")
     
+    monthly = monthly_aggregates(article_df, reviews_df)
+    
     col1, col2 = st.columns(2)
     
     with col1:
         # Articles over time
-        article_df['publication_date'] = pd.to_datetime(article_df['publication_date'])
-        article_df['month'] = article_df['publication_date'].dt.to_period('M')
-        monthly_articles = article_df.groupby('month').size().reset_index(name='count')
-        monthly_articles['month'] = monthly_articles['month'].astype(str)
+        monthly_articles = monthly['articles']
         
         fig = px.line(
             monthly_articles,
@@ -250,10 +281,7 @@ def show_data_analysis(article_df, reviews_df):
     
     with col2:
         # Reviews over time
-        reviews_df['publication_date'] = pd.to_datetime(reviews_df['publication_date'])
-        reviews_df['month'] = reviews_df['publication_date'].dt.to_period('M')
-        monthly_reviews = reviews_df.groupby('month').size().reset_index(name='count')
-        monthly_reviews['month'] = monthly_reviews['month'].astype(str)
+        monthly_reviews = monthly['reviews']
         
         fig = px.line(
             monthly_reviews,
@@ -271,23 +299,19 @@ def show_data_analysis(article_df, reviews_df):
     
     with col1:
         # Article content length
-        fig = px.histogram(
-            article_df,
-            x='content_length',
-            nbins=30,
-            title="Article Content Length Distribution",
-            labels={'content_length': 'Content Length (characters)', 'count': 'Count'}
+        fig = histogram_figure(
+            article_df['content_length'],
+            "Article Content Length Distribution",
+            'Content Length (characters)'
         )
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Review verdict length
-        fig = px.histogram(
-            reviews_df,
-            x='verdict_length',
-            nbins=30,
-            title="Review Verdict Length Distribution",
-            labels={'verdict_length': 'Verdict Length (characters)', 'count': 'Count'}
+        fig = histogram_figure(
+            reviews_df['verdict_length'],
+            "Review Verdict Length Distribution",
+            'Verdict Length (characters)'
         )
         st.plotly_chart(fig, use_container_width=True)
 
@@ -302,85 +326,51 @@ def show_nlp_insights(results):
     
     nlp_data = results['nlp_analysis']
     
-    # Sentiment analysis
-    st.write("### 😊 Sentiment Analysis")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Article sentiment
-        article_sentiment = nlp_data['article_news']['sentiment']['contents']
-        sentiment_data = pd.DataFrame([
-            {'Sentiment': 'Positive', 'Score': article_sentiment['pos']},
-            {'Sentiment': 'Neutral', 'Score': article_sentiment['neu']},
-            {'Sentiment': 'Negative', 'Score': article_sentiment['neg']}
-        ])
-        
-        fig = px.bar(
-            sentiment_data,
-            x='Sentiment',
-            y='Score',
-            title="Article Content Sentiment Distribution",
-            color='Sentiment',
-            color_discrete_map={'Positive': 'green', 'Neutral': 'gray', 'Negative': 'red'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        # Review sentiment
-        review_sentiment = nlp_data['car_reviews']['sentiment']['verdicts']
-        sentiment_data = pd.DataFrame([
-            {'Sentiment': 'Positive', 'Score': review_sentiment['pos']},
-            {'Sentiment': 'Neutral', 'Score': review_sentiment['neu']},
-            {'Sentiment': 'Negative', 'Score': review_sentiment['neg']}
-        ])
-        
-        fig = px.bar(
-            sentiment_data,
-            x='Sentiment',
-            y='Score',
-            title="Review Verdict Sentiment Distribution",
-            color='Sentiment',
-            color_discrete_map={'Positive': 'green', 'Neutral': 'gray', 'Negative': 'red'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Top bigrams and trigrams
-    st.write("### 🔤 Most Common Phrases")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Article bigrams
-        if 'bigrams' in nlp_data['article_news']:
-            title_bigrams = nlp_data['article_news']['bigrams']['titles'][:10]
-            bigram_data = pd.DataFrame(title_bigrams, columns=['Bigram', 'Count'])
-            bigram_data['Bigram'] = bigram_data['Bigram'].apply(lambda x: ' '.join(x))
-            
-            fig = px.bar(
-                bigram_data,
-                x='Count',
-                y='Bigram',
-                orientation='h',
-                title="Top Article Title Bigrams"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+    # Sentiment and the most common phrases share one figure, serialised and rendered once
+    st.write("### 😊 Sentiment Analysis and Most Common Phrases")
+    
+    bigram_panels = [
+        (section['bigrams'][field][:10], title)
+        for section, field, title in [
+            (nlp_data['article_news'], 'titles', "Top Article Title Bigrams"),
+            (nlp_data['car_reviews'], 'verdicts', "Top Review Verdict Bigrams")
+        ]
+        if 'bigrams' in section
+    ]
+    rows = 2 if bigram_panels else 1
+    fig = make_subplots(
+        rows=rows,
+        cols=2,
+        subplot_titles=["Article Content Sentiment Distribution", "Review Verdict Sentiment Distribution"]
+        + [title for _, title in bigram_panels]
+    )
     
-    with col2:
-        # Review bigrams
-        if 'bigrams' in nlp_data['car_reviews']:
-            verdict_bigrams = nlp_data['car_reviews']['bigrams']['verdicts'][:10]
-            bigram_data = pd.DataFrame(verdict_bigrams, columns=['Bigram', 'Count'])
-            bigram_data['Bigram'] = bigram_data['Bigram'].apply(lambda x: ' '.join(x))
-            
-            fig = px.bar(
-                bigram_data,
-                x='Count',
-                y='Bigram',
-                orientation='h',
-                title="Top Review Verdict Bigrams"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+    sentiment_colors = {'Positive': 'green', 'Neutral': 'gray', 'Negative': 'red'}
+    for col, sentiment in enumerate([
+        nlp_data['article_news']['sentiment']['contents'],
+        nlp_data['car_reviews']['sentiment']['verdicts']
+    ], start=1):
+        fig.add_trace(go.Bar(
+            x=list(sentiment_colors),
+            y=[sentiment['pos'], sentiment['neu'], sentiment['neg']],
+            marker_color=list(sentiment_colors.values()),
+            showlegend=False
+        ), row=1, col=col)
+        fig.update_xaxes(title_text='Sentiment', row=1, col=col)
+        fig.update_yaxes(title_text='Score', row=1, col=col)
+    
+    for col, (bigrams, _) in enumerate(bigram_panels, start=1):
+        fig.add_trace(go.Bar(
+            x=[count for _, count in bigrams],
+            y=[' '.join(bigram) for bigram, _ in bigrams],
+            orientation='h',
+            showlegend=False
+        ), row=2, col=col)
+        fig.update_xaxes(title_text='Count', row=2, col=col)
+        fig.update_yaxes(title_text='Bigram', row=2, col=col)
+    
+    fig.update_layout(height=450 * rows)
+    st.plotly_chart(fig, use_container_width=True)
 
 def show_correlations(results, reviews_df):
     """Show correlations page"""
@@ -503,20 +493,13 @@ def show_trends(article_df, reviews_df, results):
     # Time series trends
     st.write("### ⏰ Time Series Trends")
     
-    # Convert dates
-    article_df['publication_date'] = pd.to_datetime(article_df['publication_date'])
-    reviews_df['publication_date'] = pd.to_datetime(reviews_df['publication_date'])
-    
-    # Monthly trends
-    article_df['month'] = article_df['publication_date'].dt.to_period('M')
-    reviews_df['month'] = reviews_df['publication_date'].dt.to_period('M')
+    monthly = monthly_aggregates(article_df, reviews_df)
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Article volume trend
-        monthly_articles = article_df.groupby('month').size().reset_index(name='count')
-        monthly_articles['month'] = monthly_articles['month'].astype(str)
+        monthly_articles = monthly['articles']
         
         fig = px.line(
             monthly_articles,
@@ -529,8 +512,7 @@ def show_trends(article_df, reviews_df, results):
     
     with col2:
         # Review volume trend
-        monthly_reviews = reviews_df.groupby('month').size().reset_index(name='count')
-        monthly_reviews['month'] = monthly_reviews['month'].astype(str)
+        monthly_reviews = monthly['reviews']
         
         fig = px.line(
             monthly_reviews,
@@ -544,8 +526,7 @@ def show_trends(article_df, reviews_df, results):
     # Rating trends over time
     st.write("### ⭐ Rating Trends")
     
-    monthly_ratings = reviews_df.groupby('month')['rating'].agg(['mean', 'count']).reset_index()
-    monthly_ratings['month'] = monthly_ratings['month'].astype(str)
+    monthly_ratings = monthly['ratings']
     
     fig = px.line(
         monthly_ratings,
@@ -559,8 +540,7 @@ def show_trends(article_df, reviews_df, results):
     # Price trends over time
     st.write("### 💰 Price Trends")
     
-    monthly_prices = reviews_df.groupby('month')['price'].agg(['mean', 'count']).reset_index()
-    monthly_prices['month'] = monthly_prices['month'].astype(str)
+    monthly_prices = monthly['prices']
     
     fig = px.line(
         monthly_prices,
@@ -571,6 +551,46 @@ def show_trends(article_df, reviews_df, results):
     )
     st.plotly_chart(fig, use_container_width=True)
 
+@st.cache_data
+def to_csv_bytes(df):
+    """Serialise and cache a dataset for download, once per dataset instead of every rerun"""
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.cache_data
+def to_parquet_bytes(df):
+    """Serialise and cache a dataset as zstd Parquet, keeping its dtypes and dictionary-encoded columns"""
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, engine='pyarrow', compression='zstd', index=False)
+    return buffer.getvalue()
+
+def show_download_buttons(df, label, file_stem):
+    """Offer a dataset as Parquet, building the much larger CSV only when asked for"""
+    st.download_button(
+        label=f"Download {label} Parquet",
+        data=to_parquet_bytes(df),
+        file_name=f"{file_stem}.parquet",
+        mime="application/octet-stream"
+    )
+    if st.checkbox(f"Also prepare {label} CSV", key=f"{file_stem}_csv"):
+        st.download_button(
+            label=f"Download {label} CSV",
+            data=to_csv_bytes(df),
+            file_name=f"{file_stem}.csv",
+            mime="text/csv"
+        )
+
+@st.cache_data
+def describe_data(df):
+    """Compute and cache summary statistics for a dataset"""
+    return df.describe()
+
+def show_paged_dataframe(df, key):
+    """Show one page of rows at a time instead of sending the whole frame to the browser"""
+    pages = max(1, -(-len(df) // RAW_DATA_PAGE_ROWS))
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, key=key)
+    start = (page - 1) * RAW_DATA_PAGE_ROWS
+    st.dataframe(df.iloc[start:start + RAW_DATA_PAGE_ROWS], use_container_width=True)
+
 def show_raw_data(article_df, reviews_df):
     """Show raw data page"""
     
@@ -581,36 +601,24 @@ def show_raw_data(article_df, reviews_df):
     
     if data_type == "Article News":
         st.write("### Article News Data")
-        st.dataframe(article_df, use_container_width=True)
+        show_paged_dataframe(article_df, key="article_news_page")
         
-        # Download button
-        csv = article_df.to_csv(index=False)
-        st.download_button(
-            label="Download Article News CSV",
-            data=csv,
-            file_name="article_news_data.csv",
-            mime="text/csv"
-        )
+        # Download buttons
+        show_download_buttons(article_df, "Article News", "article_news_data")
     else:
         st.write("### Car Reviews Data")
-        st.dataframe(reviews_df, use_container_width=True)
+        show_paged_dataframe(reviews_df, key="car_reviews_page")
         
-        # Download button
-        csv = reviews_df.to_csv(index=False)
-        st.download_button(
-            label="Download Car Reviews CSV",
-            data=csv,
-            file_name="car_reviews_data.csv",
-            mime="text/csv"
-        )
+        # Download buttons
+        show_download_buttons(reviews_df, "Car Reviews", "car_reviews_data")
     
     # Data statistics
     st.write("### 📊 Data Statistics")
     
     if data_type == "Article News":
-        st.write(article_df.describe())
+        st.write(describe_data(article_df))
     else:
-        st.write(reviews_df.describe())
+        st.write(describe_data(reviews_df))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,96 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from unittest.mock import Mock
+from analysis import data_loader
+from analysis.data_loader import DataLoader, _text_features
+from auto_intel.items import ArticleItem, CarReviewItem
+from auto_intel.pipelines import ParquetPipeline
+
+
+class TestTextFeatures:
+    """Test cases for the Arrow text feature kernels"""
+
+    def test_chunked_column_matches_str_split(self):
+        """Test that a multi-chunk Arrow column gives the same features as plain Python"""
+        chunks = [["  Great car ", "a b c"], [None, "one  two\tthree"]]
+        values = pd.Series(pd.arrays.ArrowStringArray(pa.chunked_array(chunks)))
+
+        stripped, lengths, word_counts = _text_features(values)
+
+        assert stripped.tolist()[:2] + stripped.tolist()[3:] == ["Great car", "a b c", "one  two\tthree"]
+        assert pd.isna(stripped.iloc[2])
+        assert lengths.tolist()[:2] + lengths.tolist()[3:] == [9, 5, 14]
+        assert word_counts.tolist()[:2] + word_counts.tolist()[3:] == [2, 3, 3]
+
+
+class TestDataLoader:
+    """Test cases for DataLoader on multi-chunk inputs"""
+
+    def _review(self, index):
+        return CarReviewItem(
+            title=f"Review {index}",
+            link=f"https://example.com/review-{index}",
+            source="Test Source",
+            publication_date="2024-01-15",
+            verdict=f"Great car number {index}",
+            rating="4.5 stars",
+            price="£25,000"
+        )
+
+    def _article(self, index):
+        return ArticleItem(
+            title=f"Article {index}",
+            link=f"https://example.com/article-{index}",
+            source="Test Source",
+            publication_date="15 Jan 2024",
+            content=f"Some news about car {index}"
+        )
+
+    def test_parquet_pipeline_output_with_several_row_groups(self, tmp_path):
+        """Test that datasets written in several row groups preprocess and summarise"""
+        spider = Mock()
+        spider.name = "auto_reviews"
+        pipeline = ParquetPipeline(str(tmp_path), batch_size=2)
+        pipeline.open_spider(spider)
+        for index in range(5):
+            pipeline.process_item(self._review(index), spider)
+            pipeline.process_item(self._article(index), spider)
+        pipeline.close_spider(spider)
+
+        loader = DataLoader(str(tmp_path / "articles"), str(tmp_path / "reviews"))
+        reviews = loader.processed_reviews_df
+        assert len(reviews) == 5
+        assert reviews['verdict_word_count'].tolist() == [4] * 5
+
+        summary = loader.get_data_summary()
+        assert summary['article_news']['total_records'] == 5
+        assert summary['car_reviews']['avg_price'] == 25000
+
+    def test_csv_read_in_several_blocks(self, tmp_path, monkeypatch):
+        """Test that a CSV parsed in more than one Arrow block preprocesses"""
+        monkeypatch.setattr(data_loader, 'CSV_READ_OPTIONS', pa_csv.ReadOptions(block_size=256))
+        rows = range(40)
+        pd.DataFrame({
+            'title': [f"Article {i}" for i in rows],
+            'link': [f"https://example.com/{i}" for i in rows],
+            'author': ["Author"] * 40,
+            'publication_date': ["2024-01-15"] * 40,
+            'source': ["Test Source"] * 40,
+            'content': [f"Some news about car {i}" for i in rows],
+        }).to_csv(tmp_path / "articles.csv", index=False)
+        pd.DataFrame({
+            'title': [f"Review {i}" for i in rows],
+            'link': [f"https://example.com/r{i}" for i in rows],
+            'author': ["Author"] * 40,
+            'publication_date': ["2024-01-15"] * 40,
+            'source': ["Test Source"] * 40,
+            'verdict': [f"Great car number {i}" for i in rows],
+            'rating': [3.2] * 40,
+            'price': [25000] * 40,
+        }).to_csv(tmp_path / "reviews.csv", index=False)
+
+        loader = DataLoader(str(tmp_path / "articles.csv"), str(tmp_path / "reviews.csv"))
+        summary = loader.get_data_summary()
+        assert summary['article_news']['total_records'] == 40
+        assert loader.processed_article_df['content_word_count'].tolist() == [5] * 40
@@ -0,0 +1,259 @@
+import pytest
+from contextlib import contextmanager
+from unittest.mock import Mock
+import psycopg
+import pyarrow.parquet as pq
+from scrapy.exceptions import DropItem
+from twisted.internet import reactor
+from auto_intel import pipelines
+from auto_intel.items import ArticleItem, CarReviewItem
+from auto_intel.pipelines import ParquetPipeline, PostgresPipeline
+
+
+class TestParquetPipeline:
+    """Test cases for ParquetPipeline"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.spider = Mock()
+        self.spider.name = "auto_reviews"
+
+    def _review(self, index):
+        return CarReviewItem(
+            title=f"Review {index}",
+            link=f"https://example.com/review-{index}",
+            source="Test Source",
+            publication_date="2024-01-15",
+            verdict="Great car",
+            rating="4.5 stars",
+            price="£25,000"
+        )
+
+    def test_items_written_to_date_partition(self, tmp_path):
+        """Test that validated items are flushed in batches into the date partition"""
+        pipeline = ParquetPipeline(str(tmp_path), batch_size=2)
+        pipeline.open_spider(self.spider)
+        for index in range(3):
+            pipeline.process_item(self._review(index), self.spider)
+        pipeline.close_spider(self.spider)
+
+        files = list((tmp_path / "reviews").glob("date=*/*.parquet"))
+        assert len(files) == 1
+
+        parquet_file = pq.ParquetFile(files[0])
+        assert parquet_file.metadata.num_row_groups == 2
+
+        table = parquet_file.read()
+        assert table.num_rows == 3
+        assert table.column("price").to_pylist() == [25000] * 3
+        assert table.column("rating").to_pylist() == [4.5] * 3
+
+    def test_articles_and_reviews_kept_apart(self, tmp_path):
+        """Test that each item type gets its own dataset"""
+        pipeline = ParquetPipeline(str(tmp_path))
+        pipeline.open_spider(self.spider)
+        pipeline.process_item(self._review(0), self.spider)
+        pipeline.process_item(ArticleItem(
+            title="Test Article",
+            link="https://example.com/article",
+            source="Test Source",
+            publication_date="15 Jan 2024"
+        ), self.spider)
+        pipeline.close_spider(self.spider)
+
+        assert len(list((tmp_path / "articles").glob("date=*/*.parquet"))) == 1
+        assert len(list((tmp_path / "reviews").glob("date=*/*.parquet"))) == 1
+
+    def test_invalid_item_dropped(self, tmp_path):
+        """Test that items failing validation are dropped"""
+        pipeline = ParquetPipeline(str(tmp_path))
+        pipeline.open_spider(self.spider)
+
+        with pytest.raises(DropItem):
+            pipeline.process_item(CarReviewItem(title="  ", link="not-a-url", source="Test"), self.spider)
+
+
+class FakeCopy:
+    """COPY context that stages written rows on its connection"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set_types(self, types):
+        pass
+
+    def write_row(self, row):
+        if row[1] in self.connection.pool.failing_links:
+            raise self.connection.pool.failure
+        self.connection.inserted.append(row)
+
+
+class FakeCursor:
+    """Cursor whose COPY goes to FakeCopy"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def copy(self, statement):
+        return FakeCopy(self.connection)
+
+    def execute(self, statement):
+        pass
+
+
+class FakeConnection:
+    """Connection that keeps inserted rows until they are committed or rolled back"""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.closed = False
+        self.inserted = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def execute(self, statement):
+        return [(link,) for link in self.pool.stored]
+
+    def commit(self):
+        self.pool.commits.append(len(self.inserted))
+        self.pool.stored.extend(row[1] for row in self.inserted)
+        self.inserted = []
+
+    def rollback(self):
+        self.pool.rollbacks += 1
+        self.inserted = []
+
+
+class FakePool:
+    """Stand-in for psycopg_pool.ConnectionPool recording what reaches the database"""
+
+    def __init__(self, **kwargs):
+        self.stored = []
+        self.commits = []
+        self.rollbacks = 0
+        self.checked_out = 0
+        self.closed = False
+        self.failing_links = set()
+        self.failure = psycopg.DataError("bad row")
+
+    def wait(self):
+        pass
+
+    @contextmanager
+    def connection(self):
+        yield FakeConnection(self)
+
+    def getconn(self):
+        self.checked_out += 1
+        return FakeConnection(self)
+
+    def putconn(self, connection):
+        self.checked_out -= 1
+
+    def close(self):
+        self.closed = True
+
+
+class TestPostgresPipeline:
+    """Test cases for PostgresPipeline against a fake connection pool"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.spider = Mock()
+        self.spider.name = "auto_reviews"
+
+    @pytest.fixture(autouse=True)
+    def fake_database(self, monkeypatch):
+        """Route the pipeline's pool, settings and reactor callback to in-process fakes"""
+        monkeypatch.setattr(pipelines, 'ConnectionPool', FakePool)
+        monkeypatch.setattr(pipelines, 'config', lambda name: name.lower())
+        monkeypatch.setattr(reactor, 'callFromThread', lambda function, *args: function(*args))
+
+    def _review(self, index):
+        return CarReviewItem(
+            title=f"Review {index}",
+            link=f"https://example.com/review-{index}",
+            source="Test Source",
+            publication_date="2024-01-15",
+            verdict="Great car",
+            rating="4.5 stars",
+            price="£25,000"
+        )
+
+    def _close(self, pipeline):
+        finished = pipeline.close_spider(self.spider)
+        pipeline._writer.join(timeout=5)
+        assert finished.called
+
+    def test_repeated_link_skipped_while_pending(self):
+        """Test that a link buffered earlier in the crawl is not buffered again"""
+        pipeline = PostgresPipeline(batch_size=10)
+        pipeline.open_spider(self.spider)
+        pipeline.process_item(self._review(0), self.spider)
+        pipeline.process_item(self._review(0), self.spider)
+
+        assert len(pipeline.buffers['reviews']) == 1
+        self._close(pipeline)
+        assert pipeline.pool.stored == ["https://example.com/review-0"]
+
+    def test_links_stored_only_when_committed(self):
+        """Test that links of a rolled back transaction are forgotten rather than stored"""
+        pipeline = PostgresPipeline(batch_size=1, commit_batch=1)
+        pipeline.open_spider(self.spider)
+        pipeline.pool.failing_links = {"https://example.com/review-1"}
+        for index in range(3):
+            pipeline.process_item(self._review(index), self.spider)
+        self._close(pipeline)
+
+        assert pipeline._stored_links == {
+            "https://example.com/review-0", "https://example.com/review-2"
+        }
+        assert not pipeline._pending_links
+        pipeline.process_item(self._review(1), self.spider)
+        assert "https://example.com/review-1" in pipeline._pending_links
+
+    def test_rows_inserted_in_batches_and_committed_per_commit_batch(self):
+        """Test that rows are flushed per batch and committed once per commit_batch rows"""
+        pipeline = PostgresPipeline(batch_size=2, commit_batch=4)
+        pipeline.open_spider(self.spider)
+        for index in range(10):
+            pipeline.process_item(self._review(index), self.spider)
+        self._close(pipeline)
+
+        assert pipeline.pool.commits == [4, 4, 2]
+        assert pipeline.pool.stored == [f"https://example.com/review-{index}" for index in range(10)]
+        assert pipeline.pool.checked_out == 0
+
+    def test_failed_row_rolls_back_and_returns_connection(self):
+        """Test that any error while writing a batch rolls back the transaction and frees its connection"""
+        pipeline = PostgresPipeline(batch_size=2, commit_batch=4)
+        pipeline.open_spider(self.spider)
+        pipeline.pool.failing_links = {"https://example.com/review-2"}
+        pipeline.pool.failure = TypeError("cannot dump row")
+        for index in range(8):
+            pipeline.process_item(self._review(index), self.spider)
+        self._close(pipeline)
+
+        assert pipeline.pool.rollbacks == 1
+        assert pipeline.pool.checked_out == 0
+        assert pipeline.pool.commits == [4]
+        assert pipeline.pool.stored == [f"https://example.com/review-{index}" for index in range(4, 8)]
+
+    def test_close_fires_deferred_after_pool_closed(self):
+        """Test that close_spider's Deferred fires once the remaining rows are committed and the pool closed"""
+        pipeline = PostgresPipeline(batch_size=10)
+        pipeline.open_spider(self.spider)
+        pipeline.process_item(self._review(0), self.spider)
+        finished = pipeline.close_spider(self.spider)
+        pipeline._writer.join(timeout=5)
+
+        assert finished.called
+        assert pipeline.pool.closed
+        assert pipeline.pool.commits == [1]